@@ -1,4 +1,6 @@
 """主启动文件"""
+import os
+import shutil
 import sys
 from pathlib import Path
 
@@ -9,6 +11,34 @@ from src.utils.config import config
 from src.utils.logger import logger
 
 
+def serve_production(host: str, port: int):
+    """
+    使用gunicorn启动服务（多进程+线程，替代Flask开发服务器）
+
+    未安装gunicorn时直接返回，由调用方退回Flask开发服务器
+    """
+    gunicorn = shutil.which('gunicorn')
+    if gunicorn is None:
+        logger.warning("未找到gunicorn，使用Flask开发服务器")
+        return
+
+    # 每个worker进程各自创建Tushare客户端（限流器、并发数）和缓存，多个worker会成倍占用Tushare配额，
+    # 默认只用一个worker，由线程重叠I/O等待
+    workers = config.get('app.workers') or 1
+    threads = config.get('app.threads', 16)
+
+    logger.info(f"使用gunicorn启动: workers={workers}, threads={threads}")
+    os.chdir(Path(__file__).parent)
+    os.execvp(gunicorn, [
+        gunicorn,
+        '-w', str(workers),
+        '-b', f'{host}:{port}',
+        '--worker-class', 'gthread',
+        '--threads', str(threads),
+        'src.api.app:create_app()',
+    ])
+
+
 def main():
     """主函数"""
     logger.info("=" * 60)
@@ -16,15 +46,19 @@ def main():
     logger.info("=" * 60)
 
     try:
-        # 创建Flask应用
-        logger.info("创建Flask应用...")
-        app = create_app()
-
         # 获取配置
         host = config.get('app.host', '0.0.0.0')
         port = config.get('app.port', 5000)
         debug = config.get('app.debug', False)
 
+        # 非调试模式下交由gunicorn启动（成功时不会返回）
+        if not debug:
+            serve_production(host, port)
+
+        # 创建Flask应用
+        logger.info("创建Flask应用...")
+        app = create_app()
+
         logger.info(f"Flask服务配置: {host}:{port}")
         logger.info("=" * 60)
         logger.info("应用启动成功！")
@@ -34,8 +68,8 @@ def main():
         logger.info("说明: 系统已改为实时调用Tushare API获取数据")
         logger.info("=" * 60)
 
-        # 启动Flask服务
-        app.run(host=host, port=port, debug=debug)
+        # 启动Flask服务（调试模式或未安装gunicorn）
+        app.run(host=host, port=port, debug=debug, threaded=True)
 
     except KeyboardInterrupt:
         logger.info("收到中断信号，正在关闭...")
@@ -0,0 +1,155 @@
+"""格雷厄姆评分的Numba编译内核"""
+try:
+    from numba import njit
+except ImportError:  # 未安装numba时以纯Python方式执行
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+# 阶梯评分表：阈值按升序排列，分数比阈值多一档
+# 流动比率 >= 1 / 1.5 / 2
+CURRENT_RATIO_TH = (1.0, 1.5, 2.0)
+CURRENT_RATIO_PTS = (0.0, 1.0, 3.0, 5.0)
+# 速动比率 >= 0.8 / 1
+QUICK_RATIO_TH = (0.8, 1.0)
+QUICK_RATIO_PTS = (0.0, 3.0, 5.0)
+# 资产负债率 <= 0.3 / 0.5 / 0.6
+DEBT_RATIO_TH = (0.3, 0.5, 0.6)
+DEBT_RATIO_PTS = (5.0, 3.0, 1.0, 0.0)
+# 经营现金流/净利润 >= 0.8 / 1.2
+CASH_FLOW_TH = (0.8, 1.2)
+CASH_FLOW_PTS = (0.0, 3.0, 5.0)
+# 利息保障（按资产负债率） < 0.3 / 0.5，即以 >= 阈值的档数查表
+INTEREST_TH = (0.3, 0.5)
+INTEREST_PTS = (5.0, 3.0, 0.0)
+# ROE >= 10% / 15% / 20%
+ROE_TH = (0.1, 0.15, 0.2)
+ROE_PTS = (0.0, 4.0, 6.0, 8.0)
+# 净利率 >= 5% / 10% / 15%
+NET_MARGIN_TH = (0.05, 0.1, 0.15)
+NET_MARGIN_PTS = (0.0, 3.0, 6.0, 8.0)
+# 毛利率 >= 30% / 40%
+GROSS_MARGIN_TH = (0.3, 0.4)
+GROSS_MARGIN_PTS = (0.0, 3.0, 5.0)
+# 净利润增长率 >= 0 / 10% / 20%（仅增长率为正时计分）
+PROFIT_GROWTH_TH = (0.0, 0.1, 0.2)
+PROFIT_GROWTH_PTS = (0.0, 2.0, 3.0, 4.0)
+# PE <= 10 / 15 / 20 / 25（仅PE为正时计分）
+PE_TH = (10.0, 15.0, 20.0, 25.0)
+PE_PTS = (8.0, 6.0, 4.0, 2.0, 0.0)
+# PB <= 1 / 1.5 / 2 / 3（仅PB为正时计分）
+PB_TH = (1.0, 1.5, 2.0, 3.0)
+PB_PTS = (8.0, 6.0, 4.0, 2.0, 0.0)
+# PEG <= 0.8 / 1 / 1.5
+PEG_TH = (0.8, 1.0, 1.5)
+PEG_PTS = (9.0, 7.0, 4.0, 0.0)
+# 安全边际 >= 10% / 20% / 30% / 40% / 50%
+SAFETY_MARGIN_TH = (10.0, 20.0, 30.0, 40.0, 50.0)
+SAFETY_MARGIN_PTS = (0.0, 5.0, 10.0, 15.0, 20.0, 25.0)
+
+
+@njit(cache=True)
+def tier_ge(value, thresholds, points):
+    """按 value >= 阈值 查表计分（等价于 bisect_right）"""
+    i = 0
+    for th in thresholds:
+        i += value >= th
+    return points[i]
+
+
+@njit(cache=True)
+def tier_le(value, thresholds, points):
+    """按 value <= 阈值 查表计分（等价于 bisect_left）"""
+    i = 0
+    for th in thresholds:
+        i += value > th
+    return points[i]
+
+
+@njit(cache=True)
+def score_financial_health(current_ratio, quick_ratio, debt_ratio, operating_cash_flow, net_profit):
+    """财务健康度评分 (0-25分)"""
+    score = (
+        tier_ge(current_ratio, CURRENT_RATIO_TH, CURRENT_RATIO_PTS)  # 流动比率 (5分)
+        + tier_ge(quick_ratio, QUICK_RATIO_TH, QUICK_RATIO_PTS)  # 速动比率 (5分)
+        + tier_le(debt_ratio, DEBT_RATIO_TH, DEBT_RATIO_PTS)  # 资产负债率 (5分)
+        + tier_ge(debt_ratio, INTEREST_TH, INTEREST_PTS)  # 利息保障倍数 (5分) - 简化处理
+    )
+
+    # 经营现金流 (5分)
+    if operating_cash_flow > 0 and net_profit > 0:
+        score += tier_ge(operating_cash_flow / net_profit, CASH_FLOW_TH, CASH_FLOW_PTS)
+
+    return min(25.0, score)
+
+
+@njit(cache=True)
+def score_profitability(roe, net_margin, gross_margin, net_profit_yoy):
+    """盈利能力评分 (0-25分)"""
+    score = (
+        tier_ge(roe, ROE_TH, ROE_PTS)  # ROE (8分)
+        + tier_ge(net_margin, NET_MARGIN_TH, NET_MARGIN_PTS)  # 净利率 (8分)
+        + tier_ge(gross_margin, GROSS_MARGIN_TH, GROSS_MARGIN_PTS)  # 毛利率 (5分)
+    )
+
+    # 利润增长稳定性 (4分) - 简化处理
+    if net_profit_yoy > 0:
+        score += tier_ge(net_profit_yoy, PROFIT_GROWTH_TH, PROFIT_GROWTH_PTS)
+
+    return min(25.0, score)
+
+
+@njit(cache=True)
+def score_valuation(pe_ratio, pb_ratio, eps, net_profit_yoy):
+    """估值水平评分 (0-25分)"""
+    score = 0.0
+
+    # PE估值 (8分)
+    if pe_ratio > 0:
+        score += tier_le(pe_ratio, PE_TH, PE_PTS)
+
+    # PB估值 (8分)
+    if pb_ratio > 0:
+        score += tier_le(pb_ratio, PB_TH, PB_PTS)
+
+    # PEG比率 (9分)
+    if eps > 0 and net_profit_yoy > 0 and pe_ratio > 0:
+        score += tier_le(pe_ratio / (net_profit_yoy * 100), PEG_TH, PEG_PTS)
+
+    return min(25.0, score)
+
+
+@njit(cache=True)
+def score_safety_margin(safety_margin):
+    """安全边际评分 (0-25分)"""
+    return tier_ge(safety_margin, SAFETY_MARGIN_TH, SAFETY_MARGIN_PTS)
+
+
+@njit(cache=True)
+def score_stock(roe, net_margin, gross_margin, net_profit_yoy, pe_ratio, pb_ratio, eps,
+                current_ratio, quick_ratio, debt_ratio, operating_cash_flow, net_profit,
+                safety_margin):
+    """
+    单只股票的格雷厄姆综合评分
+
+    Returns:
+        (总分, 财务健康度, 盈利能力, 估值水平, 安全边际)
+    """
+    financial_health = score_financial_health(
+        current_ratio, quick_ratio, debt_ratio, operating_cash_flow, net_profit
+    )
+    profitability = score_profitability(roe, net_margin, gross_margin, net_profit_yoy)
+    valuation = score_valuation(pe_ratio, pb_ratio, eps, net_profit_yoy)
+    safety = score_safety_margin(safety_margin)
+
+    total = financial_health + profitability + valuation + safety
+    return total, financial_health, profitability, valuation, safety
+
+
+# 导入时预先编译，避免首次请求承担JIT开销
+score_stock(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0)
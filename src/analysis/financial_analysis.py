@@ -1,13 +1,16 @@
 """财务分析模块"""
 from typing import Dict, Any, List
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.utils.logger import logger
 
 
+# 评级标签，按档位从低到高排列
+# 各档条件逐级包含（高一档成立时低档必然成立），档位即成立条件的个数
+_PROFITABILITY_LABELS = ('较差', '一般', '良好', '优秀')
+_SOLVENCY_LABELS = ('较差', '一般', '良好', '优秀')
+_GROWTH_LABELS = ('负增长', '低成长', '稳定成长', '高成长')
+
+
 class FinancialAnalyzer:
     """财务分析器"""
 
@@ -36,14 +39,12 @@ class FinancialAnalyzer:
         roe = result['roe']
         net_margin = result['net_margin']
 
-        if roe >= 0.15 and net_margin >= 0.1:
-            result['profitability_rating'] = '优秀'
-        elif roe >= 0.1 and net_margin >= 0.05:
-            result['profitability_rating'] = '良好'
-        elif roe >= 0.05:
-            result['profitability_rating'] = '一般'
-        else:
-            result['profitability_rating'] = '较差'
+        tier = (
+            int(roe >= 0.05)
+            + int(roe >= 0.1 and net_margin >= 0.05)
+            + int(roe >= 0.15 and net_margin >= 0.1)
+        )
+        result['profitability_rating'] = _PROFITABILITY_LABELS[tier]
 
         return result
 
@@ -67,14 +68,12 @@ class FinancialAnalyzer:
         current_ratio = result['current_ratio']
         debt_ratio = result['debt_ratio']
 
-        if current_ratio >= 2 and debt_ratio <= 0.4:
-            result['solvency_rating'] = '优秀'
-        elif current_ratio >= 1.5 and debt_ratio <= 0.6:
-            result['solvency_rating'] = '良好'
-        elif current_ratio >= 1:
-            result['solvency_rating'] = '一般'
-        else:
-            result['solvency_rating'] = '较差'
+        tier = (
+            int(current_ratio >= 1)
+            + int(current_ratio >= 1.5 and debt_ratio <= 0.6)
+            + int(current_ratio >= 2 and debt_ratio <= 0.4)
+        )
+        result['solvency_rating'] = _SOLVENCY_LABELS[tier]
 
         return result
 
@@ -97,14 +96,12 @@ class FinancialAnalyzer:
         revenue_yoy = result['revenue_yoy']
         net_profit_yoy = result['net_profit_yoy']
 
-        if revenue_yoy >= 0.2 and net_profit_yoy >= 0.2:
-            result['growth_rating'] = '高成长'
-        elif revenue_yoy >= 0.1 and net_profit_yoy >= 0.1:
-            result['growth_rating'] = '稳定成长'
-        elif revenue_yoy >= 0:
-            result['growth_rating'] = '低成长'
-        else:
-            result['growth_rating'] = '负增长'
+        tier = (
+            int(revenue_yoy >= 0)
+            + int(revenue_yoy >= 0.1 and net_profit_yoy >= 0.1)
+            + int(revenue_yoy >= 0.2 and net_profit_yoy >= 0.2)
+        )
+        result['growth_rating'] = _GROWTH_LABELS[tier]
 
         return result
 
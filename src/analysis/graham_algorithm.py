@@ -1,103 +1,190 @@
 """格雷厄姆价值投资算法实现"""
-import sys
-from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
-from datetime import datetime
-
-sys.path.append(str(Path(__file__).parent.parent.parent))
+from datetime import date, datetime
+from functools import lru_cache
+import numpy as np
 
 from src.utils.config import config
 from src.utils.logger import logger
+from src.analysis import _graham_numba as kernel
+from src.analysis._graham_numba import score_stock
 
 
-class GrahamAnalyzer:
-    """格雷厄姆价值投资分析器"""
+# 批量分析使用的字段（缺失值统一记为NaN，再按各项评分的缺省值填充）
+_BATCH_FIELDS = (
+    'total_market_cap', 'pe_ratio', 'pb_ratio', 'roe', 'debt_ratio', 'eps',
+    'net_profit_yoy', 'current_price', 'current_ratio', 'quick_ratio',
+    'operating_cash_flow', 'net_profit', 'net_margin', 'gross_margin',
+)
 
-    def __init__(self):
-        self.config = config
-        self.logger = logger
-        self.graham_config = config.graham
 
-    def calculate_intrinsic_value(self, eps: float, growth_rate: float = 0.05,
-                                   method: str = 'simplified') -> float:
-        """
-        计算内在价值
+def _to_columns(stocks) -> Tuple[int, Dict[str, np.ndarray]]:
+    """
+    将股票数据转换为按字段存储的float64数组（AoS -> SoA）
 
-        Args:
-            eps: 每股收益
-            growth_rate: 预期年增长率（默认5%）
-            method: 计算方法 ('simplified', 'asset_based', 'earnings_based')
+    Args:
+        stocks: 股票字典列表、DataFrame或字段名到数组的字典
 
-        Returns:
-            内在价值
-        """
-        if method == 'simplified':
-            return self._simplified_graham_formula(eps, growth_rate)
-        elif method == 'asset_based':
-            return self._asset_based_value(eps)
-        elif method == 'earnings_based':
-            return self._earnings_based_value(eps, growth_rate)
+    Returns:
+        (股票数量, 字段名到数组的字典)
+    """
+    if isinstance(stocks, (list, tuple)):
+        n = len(stocks)
+        columns = {
+            field: np.array([s.get(field) for s in stocks], dtype=np.float64)
+            for field in _BATCH_FIELDS
+        }
+        return n, columns
+
+    first = next(iter(stocks), None)
+    n = len(stocks[first]) if first is not None else 0
+    columns = {}
+    for field in _BATCH_FIELDS:
+        if field in stocks:
+            columns[field] = np.asarray(stocks[field], dtype=np.float64)
         else:
-            return self._simplified_graham_formula(eps, growth_rate)
+            columns[field] = np.full(n, np.nan)
+    return n, columns
 
-    def _simplified_graham_formula(self, eps: float, growth_rate: float) -> float:
-        """
-        简化的格雷厄姆公式
-        内在价值 = (EPS × (8.5 + 2g)) × 4.4 / Y
 
-        Args:
-            eps: 每股收益
-            growth_rate: 预期年增长率（小数形式，如0.05表示5%）
+def _fill(values: np.ndarray, default: float) -> np.ndarray:
+    """用默认值填充缺失值（对应单只股票分析中 dict.get 的缺省值）"""
+    return np.where(np.isnan(values), default, values)
 
-        Returns:
-            内在价值
-        """
-        if eps <= 0:
-            return 0
 
-        # 将增长率转换为百分比
-        g = growth_rate * 100
+def _tiers_ge(values: np.ndarray, thresholds: Tuple[float, ...], points: Tuple[float, ...]) -> np.ndarray:
+    """按 value >= 阈值 批量查表计分"""
+    return np.take(points, np.searchsorted(thresholds, values, side='right'))
 
-        # AAA公司债收益率
-        Y = self.graham_config.get('aaa_bond_yield', 0.044)
 
-        # 格雷厄姆公式
-        intrinsic_value = (eps * (8.5 + 2 * g)) * 4.4 / Y
+def _tiers_le(values: np.ndarray, thresholds: Tuple[float, ...], points: Tuple[float, ...]) -> np.ndarray:
+    """按 value <= 阈值 批量查表计分"""
+    return np.take(points, np.searchsorted(thresholds, values, side='left'))
 
-        return max(0, intrinsic_value)
 
-    def _asset_based_value(self, bvps: float) -> float:
-        """
-        基于净资产的价值
-        适用于资产型公司
+@lru_cache(maxsize=1024)
+def _graham_multiplier(growth_rate: float, aaa_bond_yield: float) -> float:
+    """
+    格雷厄姆公式中与EPS无关的系数 (8.5 + 2g) × 4.4 / Y
 
-        Args:
-            bvps: 每股净资产
+    增长率与债券收益率取值有限，按 (g, Y) 缓存后每只股票只需一次乘法
 
-        Returns:
-            内在价值
-        """
-        # 简化版：使用净资产
-        return bvps * 1.2  # 给予20%的溢价
+    Args:
+        growth_rate: 预期年增长率（小数形式）
+        aaa_bond_yield: AAA公司债收益率Y
 
-    def _earnings_based_value(self, eps: float, growth_rate: float) -> float:
+    Returns:
+        系数
+    """
+    # 将增长率转换为百分比
+    g = growth_rate * 100
+
+    return (8.5 + 2 * g) * 4.4 / aaa_bond_yield
+
+
+def _simplified_graham_formula(eps: float, growth_rate: float, aaa_bond_yield: float) -> float:
+    """
+    简化的格雷厄姆公式
+    内在价值 = (EPS × (8.5 + 2g)) × 4.4 / Y
+
+    Args:
+        eps: 每股收益
+        growth_rate: 预期年增长率（小数形式，如0.05表示5%）
+        aaa_bond_yield: AAA公司债收益率Y
+
+    Returns:
+        内在价值
+    """
+    if eps <= 0:
+        return 0
+
+    intrinsic_value = eps * _graham_multiplier(growth_rate, aaa_bond_yield)
+
+    return float(max(0, intrinsic_value))
+
+
+def _asset_based_value(bvps: float) -> float:
+    """
+    基于净资产的价值
+    适用于资产型公司
+
+    Args:
+        bvps: 每股净资产
+
+    Returns:
+        内在价值
+    """
+    # 简化版：使用净资产
+    return bvps * 1.2  # 给予20%的溢价
+
+
+def _earnings_based_value(eps: float, growth_rate: float) -> float:
+    """
+    基于盈利能力的价值
+
+    Args:
+        eps: 每股收益
+        growth_rate: 增长率
+
+    Returns:
+        内在价值
+    """
+    if eps <= 0:
+        return 0
+
+    # 根据增长率确定合理市盈率
+    reasonable_pe = 15 + growth_rate * 100
+
+    return eps * reasonable_pe
+
+
+class GrahamAnalyzer:
+    """格雷厄姆价值投资分析器"""
+
+    __slots__ = (
+        'config', 'logger', 'graham_config',
+        '_min_mcap', '_max_pe', '_max_pb', '_min_roe', '_max_debt', '_aaa_y',
+    )
+
+    def __init__(self):
+        self.config = config
+        self.logger = logger
+        self.graham_config = config.graham or {}
+
+        # 筛选标准与债券收益率在运行期间不变，构造时读取一次
+        # （YAML中写成空节点时值为None，按未配置处理）
+        filter_config = self.graham_config.get('filter') or {}
+        self._min_mcap = filter_config.get('min_market_cap', 500000000)
+        self._max_pe = filter_config.get('max_pe_ratio', 25)
+        self._max_pb = filter_config.get('max_pb_ratio', 3)
+        self._min_roe = filter_config.get('min_roe', 0.1)
+        self._max_debt = filter_config.get('max_debt_ratio', 0.6)
+        self._aaa_y = self.graham_config.get('aaa_bond_yield', 0.044)
+
+    def calculate_intrinsic_value(self, eps: float, growth_rate: float = 0.05,
+                                   method: str = 'simplified') -> float:
         """
-        基于盈利能力的价值
+        计算内在价值
 
         Args:
             eps: 每股收益
-            growth_rate: 增长率
+            growth_rate: 预期年增长率（默认5%）
+            method: 计算方法 ('simplified', 'asset_based', 'earnings_based')
 
         Returns:
             内在价值
         """
-        if eps <= 0:
-            return 0
-
-        # 根据增长率确定合理市盈率
-        reasonable_pe = 15 + growth_rate * 100
+        # 增长率保留6位小数，提高缓存命中率
+        growth_rate = round(growth_rate, 6)
 
-        return eps * reasonable_pe
+        if method == 'simplified':
+            return _simplified_graham_formula(eps, growth_rate, self._aaa_y)
+        elif method == 'asset_based':
+            return _asset_based_value(eps)
+        elif method == 'earnings_based':
+            return _earnings_based_value(eps, growth_rate)
+        else:
+            return _simplified_graham_formula(eps, growth_rate, self._aaa_y)
 
     def calculate_safety_margin(self, intrinsic_value: float, current_price: float) -> float:
         """
@@ -111,11 +198,11 @@ class GrahamAnalyzer:
             安全边际（百分比）
         """
         if intrinsic_value <= 0:
-            return -100
+            return -100.0
 
         safety_margin = ((intrinsic_value - current_price) / intrinsic_value) * 100
 
-        return safety_margin
+        return float(safety_margin)
 
     def preliminary_filter(self, stock_data: Dict[str, Any]) -> bool:
         """
@@ -127,26 +214,16 @@ class GrahamAnalyzer:
         Returns:
             是否通过筛选
         """
-        filter_config = self.graham_config.get('filter', {})
-
-        # 获取筛选标准
-        min_market_cap = filter_config.get('min_market_cap', 500000000)
-        max_pe_ratio = filter_config.get('max_pe_ratio', 25)
-        max_pb_ratio = filter_config.get('max_pb_ratio', 3)
-        min_roe = filter_config.get('min_roe', 0.1)
-        max_debt_ratio = filter_config.get('max_debt_ratio', 0.6)
-
-        # 进行筛选
-        checks = [
-            stock_data.get('total_market_cap', 0) >= min_market_cap,
-            0 < stock_data.get('pe_ratio', 0) <= max_pe_ratio,
-            0 < stock_data.get('pb_ratio', 0) <= max_pb_ratio,
-            stock_data.get('roe', 0) >= min_roe,
-            0 <= stock_data.get('debt_ratio', 1) <= max_debt_ratio,
-            stock_data.get('eps', 0) > 0,  # 必须盈利
-        ]
-
-        return all(checks)
+        # 进行筛选（按淘汰率从高到低排列，未通过的条件会立即短路返回）
+        g = stock_data.get
+        return (
+            g('total_market_cap', 0) >= self._min_mcap
+            and 0 < g('pe_ratio', 0) <= self._max_pe
+            and g('eps', 0) > 0  # 必须盈利
+            and 0 < g('pb_ratio', 0) <= self._max_pb
+            and g('roe', 0) >= self._min_roe
+            and 0 <= g('debt_ratio', 1) <= self._max_debt
+        )
 
     def calculate_graham_score(self, stock_data: Dict[str, Any],
                                  safety_margin: float) -> Tuple[float, Dict[str, float]]:
@@ -160,196 +237,32 @@ class GrahamAnalyzer:
         Returns:
             (总分, 各项评分详情)
         """
+        # 统一转换为float，保证编译内核只生成一种类型特化
+        total_score, financial_health, profitability, valuation, safety = score_stock(
+            float(stock_data.get('roe', 0)),
+            float(stock_data.get('net_margin', 0)),
+            float(stock_data.get('gross_margin', 0)),
+            float(stock_data.get('net_profit_yoy') or 0),  # 缺失或为None时按0处理
+            float(stock_data.get('pe_ratio', 999)),
+            float(stock_data.get('pb_ratio', 999)),
+            float(stock_data.get('eps', 0)),
+            float(stock_data.get('current_ratio', 0)),
+            float(stock_data.get('quick_ratio', 0)),
+            float(stock_data.get('debt_ratio', 1)),
+            float(stock_data.get('operating_cash_flow', 0)),
+            float(stock_data.get('net_profit', 1)),
+            float(safety_margin)
+        )
+
         scores = {
-            'financial_health': self._score_financial_health(stock_data),
-            'profitability': self._score_profitability(stock_data),
-            'valuation': self._score_valuation(stock_data),
-            'safety_margin': self._score_safety_margin(safety_margin)
+            'financial_health': financial_health,
+            'profitability': profitability,
+            'valuation': valuation,
+            'safety_margin': safety
         }
 
-        total_score = sum(scores.values())
-
         return total_score, scores
 
-    def _score_financial_health(self, stock_data: Dict[str, Any]) -> float:
-        """
-        财务健康度评分 (0-25分)
-
-        Args:
-            stock_data: 股票数据
-
-        Returns:
-            评分
-        """
-        score = 0
-
-        # 流动比率 (5分)
-        current_ratio = stock_data.get('current_ratio', 0)
-        if current_ratio >= 2:
-            score += 5
-        elif current_ratio >= 1.5:
-            score += 3
-        elif current_ratio >= 1:
-            score += 1
-
-        # 速动比率 (5分)
-        quick_ratio = stock_data.get('quick_ratio', 0)
-        if quick_ratio >= 1:
-            score += 5
-        elif quick_ratio >= 0.8:
-            score += 3
-
-        # 资产负债率 (5分)
-        debt_ratio = stock_data.get('debt_ratio', 1)
-        if debt_ratio <= 0.3:
-            score += 5
-        elif debt_ratio <= 0.5:
-            score += 3
-        elif debt_ratio <= 0.6:
-            score += 1
-
-        # 经营现金流 (5分)
-        operating_cash_flow = stock_data.get('operating_cash_flow', 0)
-        net_profit = stock_data.get('net_profit', 1)
-        if operating_cash_flow > 0 and net_profit > 0:
-            cash_flow_ratio = operating_cash_flow / net_profit
-            if cash_flow_ratio >= 1.2:
-                score += 5
-            elif cash_flow_ratio >= 0.8:
-                score += 3
-
-        # 利息保障倍数 (5分) - 简化处理
-        if debt_ratio < 0.3:
-            score += 5
-        elif debt_ratio < 0.5:
-            score += 3
-
-        return min(25, score)
-
-    def _score_profitability(self, stock_data: Dict[str, Any]) -> float:
-        """
-        盈利能力评分 (0-25分)
-
-        Args:
-            stock_data: 股票数据
-
-        Returns:
-            评分
-        """
-        score = 0
-
-        # ROE (8分)
-        roe = stock_data.get('roe', 0)
-        if roe >= 0.2:  # 20%
-            score += 8
-        elif roe >= 0.15:  # 15%
-            score += 6
-        elif roe >= 0.1:  # 10%
-            score += 4
-
-        # 净利率 (8分)
-        net_margin = stock_data.get('net_margin', 0)
-        if net_margin >= 0.15:  # 15%
-            score += 8
-        elif net_margin >= 0.1:  # 10%
-            score += 6
-        elif net_margin >= 0.05:  # 5%
-            score += 3
-
-        # 毛利率 (5分)
-        gross_margin = stock_data.get('gross_margin', 0)
-        if gross_margin >= 0.4:  # 40%
-            score += 5
-        elif gross_margin >= 0.3:  # 30%
-            score += 3
-
-        # 利润增长稳定性 (4分) - 简化处理
-        net_profit_yoy = stock_data.get('net_profit_yoy', 0)
-        if net_profit_yoy > 0:
-            if net_profit_yoy >= 0.2:  # 20%
-                score += 4
-            elif net_profit_yoy >= 0.1:  # 10%
-                score += 3
-            elif net_profit_yoy >= 0:
-                score += 2
-
-        return min(25, score)
-
-    def _score_valuation(self, stock_data: Dict[str, Any]) -> float:
-        """
-        估值水平评分 (0-25分)
-
-        Args:
-            stock_data: 股票数据
-
-        Returns:
-            评分
-        """
-        score = 0
-
-        pe_ratio = stock_data.get('pe_ratio', 999)
-        pb_ratio = stock_data.get('pb_ratio', 999)
-
-        # PE估值 (8分)
-        if pe_ratio > 0:
-            if pe_ratio <= 10:
-                score += 8
-            elif pe_ratio <= 15:
-                score += 6
-            elif pe_ratio <= 20:
-                score += 4
-            elif pe_ratio <= 25:
-                score += 2
-
-        # PB估值 (8分)
-        if pb_ratio > 0:
-            if pb_ratio <= 1:
-                score += 8
-            elif pb_ratio <= 1.5:
-                score += 6
-            elif pb_ratio <= 2:
-                score += 4
-            elif pb_ratio <= 3:
-                score += 2
-
-        # PEG比率 (9分)
-        eps = stock_data.get('eps', 0)
-        net_profit_yoy = stock_data.get('net_profit_yoy', 0)
-
-        if eps > 0 and net_profit_yoy > 0 and pe_ratio > 0:
-            peg = pe_ratio / (net_profit_yoy * 100)
-            if peg <= 0.8:
-                score += 9
-            elif peg <= 1:
-                score += 7
-            elif peg <= 1.5:
-                score += 4
-
-        return min(25, score)
-
-    def _score_safety_margin(self, safety_margin: float) -> float:
-        """
-        安全边际评分 (0-25分)
-
-        Args:
-            safety_margin: 安全边际百分比
-
-        Returns:
-            评分
-        """
-        if safety_margin >= 50:
-            return 25
-        elif safety_margin >= 40:
-            return 20
-        elif safety_margin >= 30:
-            return 15
-        elif safety_margin >= 20:
-            return 10
-        elif safety_margin >= 10:
-            return 5
-        else:
-            return 0
-
     def get_recommendation(self, total_score: float, safety_margin: float) -> str:
         """
         获取投资建议
@@ -370,45 +283,55 @@ class GrahamAnalyzer:
         else:
             return "不推荐"
 
-    def analyze(self, stock_data: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze(self, stock_data: Dict[str, Any], today: Optional[date] = None) -> Dict[str, Any]:
         """
         综合分析
 
         Args:
             stock_data: 股票数据
+            today: 分析日期（批量分析时由调用方传入同一日期，默认取当天）
 
         Returns:
             分析结果
         """
+        if today is None:
+            today = datetime.now().date()
+
+        g = stock_data.get
+        # 数据源可能返回numpy标量，入口处统一转换为Python float
+        current_price = float(g('current_price', 0) or 0)
+
         result = {
-            'stock_code': stock_data.get('code', ''),
-            'stock_name': stock_data.get('name', ''),
+            'stock_code': g('code', ''),
+            'stock_name': g('name', ''),
             'pass_filter': False,
             'intrinsic_value': 0,
-            'current_price': stock_data.get('current_price', 0),
+            'current_price': current_price,
             'safety_margin': -100,
             'graham_score': 0,
             'score_details': {},
             'recommendation': '不推荐',
             'risk_level': '高',
-            'analysis_date': datetime.now().date()
+            'analysis_date': today
         }
 
         # 初步筛选
         if not self.preliminary_filter(stock_data):
-            self.logger.info(f"股票 {stock_data.get('code')} 未通过初步筛选")
+            self.logger.info(f"股票 {g('code')} 未通过初步筛选")
             return result
 
         result['pass_filter'] = True
 
+        # 净利润增长率缺失时按5%估算内在价值
+        eps = float(g('eps', 0))
+        net_profit_yoy = g('net_profit_yoy')
+        growth_rate = 0.05 if net_profit_yoy is None else float(net_profit_yoy)
+
         # 计算内在价值
-        eps = stock_data.get('eps', 0)
-        growth_rate = stock_data.get('net_profit_yoy', 0.05)
         intrinsic_value = self.calculate_intrinsic_value(eps, growth_rate)
         result['intrinsic_value'] = intrinsic_value
 
         # 计算安全边际
-        current_price = stock_data.get('current_price', 0)
         safety_margin = self.calculate_safety_margin(intrinsic_value, current_price)
         result['safety_margin'] = safety_margin
 
@@ -430,3 +353,125 @@ class GrahamAnalyzer:
             result['risk_level'] = '高'
 
         return result
+
+    def analyze_batch(self, stocks, today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        批量综合分析（向量化实现，结果与逐只调用 analyze 一致）
+
+        Args:
+            stocks: 股票字典列表、DataFrame或字段名到数组的字典
+            today: 分析日期（默认取当天）
+
+        Returns:
+            分析结果，各字段为长度N的NumPy数组（analysis_date为单个日期）
+        """
+        n, col = _to_columns(stocks)
+        if isinstance(stocks, (list, tuple)):
+            codes = np.array([s.get('code', '') for s in stocks], dtype=object)
+            names = np.array([s.get('name', '') for s in stocks], dtype=object)
+        else:
+            codes = np.asarray(stocks['code'], dtype=object) if 'code' in stocks else np.full(n, '', dtype=object)
+            names = np.asarray(stocks['name'], dtype=object) if 'name' in stocks else np.full(n, '', dtype=object)
+
+        eps = _fill(col['eps'], 0)
+        roe = _fill(col['roe'], 0)
+        debt_ratio = _fill(col['debt_ratio'], 1)
+        current_price = _fill(col['current_price'], 0)
+        net_profit_yoy = _fill(col['net_profit_yoy'], 0)
+        growth_rate = np.round(_fill(col['net_profit_yoy'], 0.05), 6)
+
+        # 初步筛选
+        filter_pe = _fill(col['pe_ratio'], 0)
+        filter_pb = _fill(col['pb_ratio'], 0)
+        mask = (
+            (_fill(col['total_market_cap'], 0) >= self._min_mcap)
+            & (filter_pe > 0) & (filter_pe <= self._max_pe)
+            & (filter_pb > 0) & (filter_pb <= self._max_pb)
+            & (roe >= self._min_roe)
+            & (debt_ratio >= 0) & (debt_ratio <= self._max_debt)
+            & (eps > 0)
+        )
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # 内在价值与安全边际
+            intrinsic_value = np.where(
+                eps > 0, np.maximum(0, eps * ((8.5 + 2 * (growth_rate * 100)) * 4.4 / self._aaa_y)), 0
+            )
+            safety_margin = np.where(
+                intrinsic_value > 0, (intrinsic_value - current_price) / intrinsic_value * 100, -100
+            )
+
+            # 财务健康度
+            current_ratio = _fill(col['current_ratio'], 0)
+            quick_ratio = _fill(col['quick_ratio'], 0)
+            operating_cash_flow = _fill(col['operating_cash_flow'], 0)
+            net_profit = _fill(col['net_profit'], 1)
+            cash_flow_ok = (operating_cash_flow > 0) & (net_profit > 0)
+            cash_flow_ratio = operating_cash_flow / net_profit
+            financial_health = np.minimum(25, (
+                _tiers_ge(current_ratio, kernel.CURRENT_RATIO_TH, kernel.CURRENT_RATIO_PTS)
+                + _tiers_ge(quick_ratio, kernel.QUICK_RATIO_TH, kernel.QUICK_RATIO_PTS)
+                + _tiers_le(debt_ratio, kernel.DEBT_RATIO_TH, kernel.DEBT_RATIO_PTS)
+                + np.where(cash_flow_ok, _tiers_ge(cash_flow_ratio, kernel.CASH_FLOW_TH, kernel.CASH_FLOW_PTS), 0)
+                + _tiers_ge(debt_ratio, kernel.INTEREST_TH, kernel.INTEREST_PTS)
+            ))
+
+            # 盈利能力
+            net_margin = _fill(col['net_margin'], 0)
+            gross_margin = _fill(col['gross_margin'], 0)
+            profitability = np.minimum(25, (
+                _tiers_ge(roe, kernel.ROE_TH, kernel.ROE_PTS)
+                + _tiers_ge(net_margin, kernel.NET_MARGIN_TH, kernel.NET_MARGIN_PTS)
+                + _tiers_ge(gross_margin, kernel.GROSS_MARGIN_TH, kernel.GROSS_MARGIN_PTS)
+                + np.where(net_profit_yoy > 0,
+                           _tiers_ge(net_profit_yoy, kernel.PROFIT_GROWTH_TH, kernel.PROFIT_GROWTH_PTS), 0)
+            ))
+
+            # 估值水平
+            pe_ratio = _fill(col['pe_ratio'], 999)
+            pb_ratio = _fill(col['pb_ratio'], 999)
+            peg_ok = (eps > 0) & (net_profit_yoy > 0) & (pe_ratio > 0)
+            peg = pe_ratio / (net_profit_yoy * 100)
+            valuation = np.minimum(25, (
+                np.where(pe_ratio > 0, _tiers_le(pe_ratio, kernel.PE_TH, kernel.PE_PTS), 0)
+                + np.where(pb_ratio > 0, _tiers_le(pb_ratio, kernel.PB_TH, kernel.PB_PTS), 0)
+                + np.where(peg_ok, _tiers_le(peg, kernel.PEG_TH, kernel.PEG_PTS), 0)
+            ))
+
+        # 安全边际
+        safety_score = _tiers_ge(safety_margin, kernel.SAFETY_MARGIN_TH, kernel.SAFETY_MARGIN_PTS)
+
+        # 未通过筛选的股票保持默认结果
+        intrinsic_value = np.where(mask, intrinsic_value, 0)
+        safety_margin = np.where(mask, safety_margin, -100)
+        score_details = {
+            'financial_health': np.where(mask, financial_health, 0),
+            'profitability': np.where(mask, profitability, 0),
+            'valuation': np.where(mask, valuation, 0),
+            'safety_margin': np.where(mask, safety_score, 0),
+        }
+        total_score = sum(score_details.values())
+
+        recommendation = np.select(
+            [(total_score >= 90) & (safety_margin >= 30),
+             (total_score >= 75) & (safety_margin >= 20),
+             (total_score >= 60) & (safety_margin >= 10)],
+            ['强烈推荐', '推荐', '可考虑'], '不推荐'
+        )
+        risk_level = np.select([total_score >= 75, total_score >= 60], ['低', '中'], '高')
+
+        self.logger.info(f"批量分析完成，共{n}只股票，通过初步筛选{int(mask.sum())}只")
+
+        return {
+            'stock_code': codes,
+            'stock_name': names,
+            'pass_filter': mask,
+            'intrinsic_value': intrinsic_value,
+            'current_price': current_price,
+            'safety_margin': safety_margin,
+            'graham_score': total_score,
+            'score_details': score_details,
+            'recommendation': recommendation,
+            'risk_level': risk_level,
+            'analysis_date': today if today is not None else datetime.now().date()
+        }
@@ -1,9 +1,7 @@
 """行业分析模块"""
-from typing import Dict, Any, List
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent.parent))
+import heapq
+from typing import Dict, Any, List, Optional
+import numpy as np
 
 from src.utils.logger import logger
 
@@ -27,45 +25,45 @@ class IndustryAnalyzer:
         if not industries:
             return {}
 
+        # 一次性构建估值数组（缺失或为None的估值按0处理）
+        n = len(industries)
+        pes = np.fromiter((ind.get('pe_ratio') or 0 for ind in industries), dtype=np.float64, count=n)
+        pbs = np.fromiter((ind.get('pb_ratio') or 0 for ind in industries), dtype=np.float64, count=n)
+
         # 计算平均估值
-        total_pe = sum(ind.get('pe_ratio', 0) for ind in industries if ind.get('pe_ratio', 0) > 0)
-        total_pb = sum(ind.get('pb_ratio', 0) for ind in industries if ind.get('pb_ratio', 0) > 0)
-        count = len([ind for ind in industries if ind.get('pe_ratio', 0) > 0])
+        valid = pes > 0
+        count = int(valid.sum())
 
-        avg_pe = total_pe / count if count > 0 else 0
-        avg_pb = total_pb / count if count > 0 else 0
+        avg_pe = float(pes[valid].sum()) / count if count > 0 else 0
+        avg_pb = float(pbs[pbs > 0].sum()) / count if count > 0 else 0
 
         # 找出低估和高估行业
-        undervalued = []
-        overvalued = []
-
-        for industry in industries:
-            pe = industry.get('pe_ratio', 0)
-            if pe > 0:
-                if pe < avg_pe * 0.8:
-                    undervalued.append(industry)
-                elif pe > avg_pe * 1.2:
-                    overvalued.append(industry)
+        undervalued = [industries[i] for i in np.flatnonzero(valid & (pes < avg_pe * 0.8))[:10]]
+        overvalued = [industries[i] for i in np.flatnonzero(valid & (pes > avg_pe * 1.2))[:10]]
 
         return {
             'average_pe': avg_pe,
             'average_pb': avg_pb,
-            'undervalued_industries': undervalued[:10],  # 前10个低估行业
-            'overvalued_industries': overvalued[:10]  # 前10个高估行业
+            'undervalued_industries': undervalued,  # 前10个低估行业
+            'overvalued_industries': overvalued  # 前10个高估行业
         }
 
     def rank_industries(self, industries: List[Dict[str, Any]],
-                        by: str = 'price_change') -> List[Dict[str, Any]]:
+                        by: str = 'price_change',
+                        top_n: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         行业排名
 
         Args:
             industries: 行业数据列表
             by: 排名依据 ('price_change', 'turnover', 'pe_ratio')
+            top_n: 只返回前N个，None表示返回全部
 
         Returns:
             排名后的行业列表
         """
+        if top_n is not None:
+            return heapq.nlargest(top_n, industries, key=lambda x: x.get(by, 0))
         return sorted(industries, key=lambda x: x.get(by, 0), reverse=True)
 
     def identify_hot_industries(self, industries: List[Dict[str, Any]],
@@ -81,21 +79,11 @@ class IndustryAnalyzer:
             热门行业列表
         """
         # 综合考虑涨跌幅和成交额
-        scored_industries = []
-
-        for industry in industries:
-            price_change = industry.get('price_change', 0)
-            turnover = industry.get('turnover', 0)
-
+        def hot_score(industry: Dict[str, Any]) -> float:
             # 简单评分：涨跌幅权重60%，成交额权重40%
-            score = price_change * 0.6 + (turnover / 1e10) * 0.4
-
-            scored_industries.append({
-                **industry,
-                'hot_score': score
-            })
+            return industry.get('price_change', 0) * 0.6 + (industry.get('turnover', 0) / 1e10) * 0.4
 
-        # 按评分排序
-        scored_industries.sort(key=lambda x: x['hot_score'], reverse=True)
+        # 只保留前N个，评分仅附加到入选的行业上
+        top_industries = heapq.nlargest(top_n, industries, key=hot_score)
 
-        return scored_industries[:top_n]
+        return [{**industry, 'hot_score': hot_score(industry)} for industry in top_industries]
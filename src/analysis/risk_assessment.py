@@ -1,13 +1,99 @@
 """风险评估模块"""
-from typing import Dict, Any
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent.parent))
+from bisect import bisect_left, bisect_right
+from typing import Dict, Any, Tuple
+import numpy as np
 
 from src.utils.logger import logger
 
 
+# 阶梯风险表：阈值按升序排列，分数比阈值多一档
+# PE > 20 / 30 / 50
+PE_RISK_TH = (20, 30, 50)
+PE_RISK_PTS = (0, 15, 30, 50)
+# PB > 2 / 3 / 5
+PB_RISK_TH = (2, 3, 5)
+PB_RISK_PTS = (0, 15, 30, 50)
+# 资产负债率 > 60% / 70%
+DEBT_RISK_TH = (0.6, 0.7)
+DEBT_RISK_PTS = (0, 25, 40)
+# 流动比率 < 1 / 1.5
+CURRENT_RATIO_RISK_TH = (1, 1.5)
+CURRENT_RATIO_RISK_PTS = (30, 15, 0)
+# ROE < 0 / 5%
+ROE_RISK_TH = (0, 0.05)
+ROE_RISK_PTS = (30, 20, 0)
+# 换手率 < 0.5 / 1
+TURNOVER_RISK_TH = (0.5, 1)
+TURNOVER_RISK_PTS = (30, 15, 0)
+# 流通市值 < 10亿 / 50亿
+CIRC_MCAP_RISK_TH = (1e9, 5e9)
+CIRC_MCAP_RISK_PTS = (40, 20, 0)
+# 振幅 > 3 / 5 / 10
+AMPLITUDE_RISK_TH = (3, 5, 10)
+AMPLITUDE_RISK_PTS = (0, 15, 30, 60)
+
+
+def _tier_gt(value: float, thresholds: Tuple[float, ...], points: Tuple[int, ...]) -> int:
+    """按 value > 阈值 查表计分"""
+    return points[bisect_left(thresholds, value)]
+
+
+def _tier_ge(value: float, thresholds: Tuple[float, ...], points: Tuple[int, ...]) -> int:
+    """按 value >= 阈值 查表计分"""
+    return points[bisect_right(thresholds, value)]
+
+
+def _value(data: Dict[str, Any], field: str) -> float:
+    """读取指标值，缺失、None或NaN统一按0处理（与批量评估的缺失值处理一致）"""
+    value = data.get(field)
+    if value is None or value != value:
+        return 0
+    return value
+
+
+# 批量评估使用的字段（缺失、None或NaN统一按0处理，与逐只评估一致）
+_BATCH_FIELDS = (
+    'pe_ratio', 'pb_ratio', 'debt_ratio', 'current_ratio', 'roe',
+    'turnover_rate', 'circulating_market_cap', 'amplitude',
+)
+
+
+def _to_columns(stocks) -> Tuple[int, Dict[str, np.ndarray]]:
+    """
+    将股票数据转换为按字段存储的float64数组，缺失值填0
+
+    Args:
+        stocks: 股票字典列表、DataFrame或字段名到数组的字典
+
+    Returns:
+        (股票数量, 字段名到数组的字典)
+    """
+    if isinstance(stocks, (list, tuple)):
+        n = len(stocks)
+        columns = {
+            field: np.array([s.get(field, 0) for s in stocks], dtype=np.float64)
+            for field in _BATCH_FIELDS
+        }
+    else:
+        first = next(iter(stocks), None)
+        n = len(stocks[first]) if first is not None else 0
+        columns = {
+            field: np.asarray(stocks[field], dtype=np.float64) if field in stocks else np.zeros(n)
+            for field in _BATCH_FIELDS
+        }
+    return n, {field: np.nan_to_num(values, nan=0.0) for field, values in columns.items()}
+
+
+def _tiers_gt(values: np.ndarray, thresholds: Tuple[float, ...], points: Tuple[int, ...]) -> np.ndarray:
+    """按 value > 阈值 批量查表计分"""
+    return np.take(points, np.searchsorted(thresholds, values, side='left'))
+
+
+def _tiers_ge(values: np.ndarray, thresholds: Tuple[float, ...], points: Tuple[int, ...]) -> np.ndarray:
+    """按 value >= 阈值 批量查表计分"""
+    return np.take(points, np.searchsorted(thresholds, values, side='right'))
+
+
 class RiskAssessor:
     """风险评估器"""
 
@@ -26,15 +112,20 @@ class RiskAssessor:
         Returns:
             风险评估结果
         """
+        valuation_risk = self._assess_valuation_risk(stock_data)
+        financial_risk = self._assess_financial_risk(financial_data or stock_data)
+        liquidity_risk = self._assess_liquidity_risk(stock_data)
+        volatility_risk = self._assess_volatility_risk(stock_data)
+
         risk_factors = {
-            'valuation_risk': self._assess_valuation_risk(stock_data),
-            'financial_risk': self._assess_financial_risk(financial_data or stock_data),
-            'liquidity_risk': self._assess_liquidity_risk(stock_data),
-            'volatility_risk': self._assess_volatility_risk(stock_data)
+            'valuation_risk': valuation_risk,
+            'financial_risk': financial_risk,
+            'liquidity_risk': liquidity_risk,
+            'volatility_risk': volatility_risk
         }
 
         # 计算总体风险等级
-        risk_score = sum(risk_factors.values()) / len(risk_factors)
+        risk_score = (valuation_risk + financial_risk + liquidity_risk + volatility_risk) / 4
 
         if risk_score <= 30:
             overall_risk = '低'
@@ -49,6 +140,49 @@ class RiskAssessor:
             'risk_factors': risk_factors
         }
 
+    def assess_risk_batch(self, stocks) -> Dict[str, Any]:
+        """
+        批量风险评估（向量化实现，结果与逐只调用 assess_risk 一致）
+
+        Args:
+            stocks: 股票字典列表、DataFrame或字段名到数组的字典
+
+        Returns:
+            风险评估结果，各字段为长度N的NumPy数组
+        """
+        n, col = _to_columns(stocks)
+
+        valuation_risk = np.minimum(100, (
+            _tiers_gt(col['pe_ratio'], PE_RISK_TH, PE_RISK_PTS)
+            + _tiers_gt(col['pb_ratio'], PB_RISK_TH, PB_RISK_PTS)
+        ))
+        financial_risk = np.minimum(100, (
+            _tiers_gt(col['debt_ratio'], DEBT_RISK_TH, DEBT_RISK_PTS)
+            + _tiers_ge(col['current_ratio'], CURRENT_RATIO_RISK_TH, CURRENT_RATIO_RISK_PTS)
+            + _tiers_ge(col['roe'], ROE_RISK_TH, ROE_RISK_PTS)
+        ))
+        liquidity_risk = np.minimum(100, (
+            _tiers_ge(col['turnover_rate'], TURNOVER_RISK_TH, TURNOVER_RISK_PTS)
+            + _tiers_ge(col['circulating_market_cap'], CIRC_MCAP_RISK_TH, CIRC_MCAP_RISK_PTS)
+        ))
+        volatility_risk = np.minimum(100, _tiers_gt(col['amplitude'], AMPLITUDE_RISK_TH, AMPLITUDE_RISK_PTS))
+
+        risk_score = (valuation_risk + financial_risk + liquidity_risk + volatility_risk) / 4
+        overall_risk = np.select([risk_score <= 30, risk_score <= 60], ['低', '中'], '高')
+
+        self.logger.info(f"批量风险评估完成，共{n}只股票")
+
+        return {
+            'overall_risk': overall_risk,
+            'risk_score': risk_score,
+            'risk_factors': {
+                'valuation_risk': valuation_risk,
+                'financial_risk': financial_risk,
+                'liquidity_risk': liquidity_risk,
+                'volatility_risk': volatility_risk
+            }
+        }
+
     def _assess_valuation_risk(self, stock_data: Dict[str, Any]) -> float:
         """
         估值风险评估 (0-100)
@@ -59,26 +193,13 @@ class RiskAssessor:
         Returns:
             风险分数（越高风险越大）
         """
-        pe_ratio = stock_data.get('pe_ratio', 0)
-        pb_ratio = stock_data.get('pb_ratio', 0)
-
-        risk_score = 0
-
-        # PE风险
-        if pe_ratio > 50:
-            risk_score += 50
-        elif pe_ratio > 30:
-            risk_score += 30
-        elif pe_ratio > 20:
-            risk_score += 15
-
-        # PB风险
-        if pb_ratio > 5:
-            risk_score += 50
-        elif pb_ratio > 3:
-            risk_score += 30
-        elif pb_ratio > 2:
-            risk_score += 15
+        pe_ratio = _value(stock_data, 'pe_ratio')
+        pb_ratio = _value(stock_data, 'pb_ratio')
+
+        risk_score = (
+            _tier_gt(pe_ratio, PE_RISK_TH, PE_RISK_PTS)  # PE风险
+            + _tier_gt(pb_ratio, PB_RISK_TH, PB_RISK_PTS)  # PB风险
+        )
 
         return min(100, risk_score)
 
@@ -92,29 +213,15 @@ class RiskAssessor:
         Returns:
             风险分数
         """
-        debt_ratio = financial_data.get('debt_ratio', 0)
-        current_ratio = financial_data.get('current_ratio', 0)
-        roe = financial_data.get('roe', 0)
-
-        risk_score = 0
-
-        # 负债风险
-        if debt_ratio > 0.7:
-            risk_score += 40
-        elif debt_ratio > 0.6:
-            risk_score += 25
-
-        # 流动性风险
-        if current_ratio < 1:
-            risk_score += 30
-        elif current_ratio < 1.5:
-            risk_score += 15
-
-        # 盈利能力风险
-        if roe < 0:
-            risk_score += 30
-        elif roe < 0.05:
-            risk_score += 20
+        debt_ratio = _value(financial_data, 'debt_ratio')
+        current_ratio = _value(financial_data, 'current_ratio')
+        roe = _value(financial_data, 'roe')
+
+        risk_score = (
+            _tier_gt(debt_ratio, DEBT_RISK_TH, DEBT_RISK_PTS)  # 负债风险
+            + _tier_ge(current_ratio, CURRENT_RATIO_RISK_TH, CURRENT_RATIO_RISK_PTS)  # 流动性风险
+            + _tier_ge(roe, ROE_RISK_TH, ROE_RISK_PTS)  # 盈利能力风险
+        )
 
         return min(100, risk_score)
 
@@ -128,22 +235,13 @@ class RiskAssessor:
         Returns:
             风险分数
         """
-        turnover_rate = stock_data.get('turnover_rate', 0)
-        circulating_market_cap = stock_data.get('circulating_market_cap', 0)
+        turnover_rate = _value(stock_data, 'turnover_rate')
+        circulating_market_cap = _value(stock_data, 'circulating_market_cap')
 
-        risk_score = 0
-
-        # 换手率风险
-        if turnover_rate < 0.5:
-            risk_score += 30
-        elif turnover_rate < 1:
-            risk_score += 15
-
-        # 流通市值风险
-        if circulating_market_cap < 1e9:  # 10亿
-            risk_score += 40
-        elif circulating_market_cap < 5e9:  # 50亿
-            risk_score += 20
+        risk_score = (
+            _tier_ge(turnover_rate, TURNOVER_RISK_TH, TURNOVER_RISK_PTS)  # 换手率风险
+            + _tier_ge(circulating_market_cap, CIRC_MCAP_RISK_TH, CIRC_MCAP_RISK_PTS)  # 流通市值风险
+        )
 
         return min(100, risk_score)
 
@@ -157,16 +255,9 @@ class RiskAssessor:
         Returns:
             风险分数
         """
-        amplitude = stock_data.get('amplitude', 0)
-
-        risk_score = 0
+        amplitude = _value(stock_data, 'amplitude')
 
         # 振幅风险
-        if amplitude > 10:
-            risk_score += 60
-        elif amplitude > 5:
-            risk_score += 30
-        elif amplitude > 3:
-            risk_score += 15
+        risk_score = _tier_gt(amplitude, AMPLITUDE_RISK_TH, AMPLITUDE_RISK_PTS)
 
         return min(100, risk_score)
@@ -1,13 +1,10 @@
 """Flask应用主文件"""
-import sys
-from pathlib import Path
 from flask import Flask
 from flask_cors import CORS
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
-
 from src.utils.config import config
 from src.utils.logger import logger
+from .json_provider import ORJSONProvider
 from .routes import register_routes
 
 
@@ -15,9 +12,8 @@ def create_app():
     """创建Flask应用"""
     app = Flask(__name__)
 
-    # 配置
-    app.config['JSON_AS_ASCII'] = False
-    app.config['JSON_SORT_KEYS'] = False
+    # JSON序列化（中文不转义、不排序键）
+    app.json = ORJSONProvider(app)
 
     # CORS配置
     cors_origins = config.get('api.cors_origins', ['*'])
@@ -1,31 +1,43 @@
 """API控制器 - 直接从Tushare获取数据"""
-from flask import request, jsonify
-from datetime import datetime
-import sys
-from pathlib import Path
+from dataclasses import asdict
 
-sys.path.append(str(Path(__file__).parent.parent.parent))
+from flask import request, jsonify
+from datetime import date
 
-from src.data_source.data_fetcher import DataFetcher
+from src.data_source.data_fetcher import get_default_fetcher
 from src.utils.logger import logger
 
 
-class IndustryController:
-    """行业控制器"""
+def _success(data):
+    """
+    成功响应（响应时间由HTTP Date头提供，正文不含时间戳，内容不变时ETag保持不变）
+
+    Args:
+        data: 响应数据
+
+    Returns:
+        JSON响应
+    """
+    return jsonify({'code': 200, 'message': 'success', 'data': data})
+
+
+class BaseController:
+    """控制器基类"""
 
-    def __init__(self):
-        self.fetcher = DataFetcher()
+    @property
+    def fetcher(self):
+        """共享的DataFetcher，首次处理请求时才创建（避免导入时初始化Tushare客户端）"""
+        return get_default_fetcher()
+
+
+class IndustryController(BaseController):
+    """行业控制器"""
 
     def get_industries(self):
         """获取所有行业列表"""
         try:
             industries = self.fetcher.fetch_industries()
-            return jsonify({
-                'code': 200,
-                'message': 'success',
-                'data': industries,
-                'timestamp': datetime.now().isoformat()
-            })
+            return _success(industries)
         except Exception as e:
             logger.error(f"获取行业列表失败: {e}")
             return jsonify({
@@ -37,8 +49,7 @@ class IndustryController:
     def get_industry(self, code):
         """获取特定行业详情"""
         try:
-            industries = self.fetcher.fetch_industries()
-            industry = next((ind for ind in industries if ind.get('code') == code), None)
+            industry = self.fetcher.fetch_industries_by_code().get(code)
 
             if not industry:
                 return jsonify({
@@ -47,12 +58,7 @@ class IndustryController:
                     'data': None
                 }), 404
 
-            return jsonify({
-                'code': 200,
-                'message': 'success',
-                'data': industry,
-                'timestamp': datetime.now().isoformat()
-            })
+            return _success(industry)
         except Exception as e:
             logger.error(f"获取行业详情失败: {e}")
             return jsonify({'code': 500, 'message': str(e)}), 500
@@ -60,31 +66,15 @@ class IndustryController:
     def get_industry_ranking(self):
         """获取行业排名"""
         try:
-            industries = self.fetcher.fetch_industries()
-            # 按涨跌幅排序
-            sorted_industries = sorted(
-                industries,
-                key=lambda x: x.get('price_change', 0),
-                reverse=True
-            )[:20]
-
-            return jsonify({
-                'code': 200,
-                'message': 'success',
-                'data': sorted_industries,
-                'timestamp': datetime.now().isoformat()
-            })
+            return _success(self.fetcher.fetch_industry_ranking(top_n=20))
         except Exception as e:
             logger.error(f"获取行业排名失败: {e}")
             return jsonify({'code': 500, 'message': str(e)}), 500
 
 
-class StockController:
+class StockController(BaseController):
     """股票控制器"""
 
-    def __init__(self):
-        self.fetcher = DataFetcher()
-
     def get_stocks(self):
         """获取股票列表"""
         try:
@@ -96,21 +86,15 @@ class StockController:
             stocks = self.fetcher.fetch_stocks(market=market)
             total = len(stocks)
 
-            # 手动分页
+            # 直接对缓存的股票元组切片分页
             start = (page - 1) * per_page
-            end = start + per_page
-            paginated_stocks = stocks[start:end]
+            paginated_stocks = stocks[start:start + per_page]
 
-            return jsonify({
-                'code': 200,
-                'message': 'success',
-                'data': {
-                    'items': paginated_stocks,
-                    'total': total,
-                    'page': page,
-                    'per_page': per_page
-                },
-                'timestamp': datetime.now().isoformat()
+            return _success({
+                'items': paginated_stocks,
+                'total': total,
+                'page': page,
+                'per_page': per_page
             })
         except Exception as e:
             logger.error(f"获取股票列表失败: {e}")
@@ -120,33 +104,29 @@ class StockController:
         """获取股票详情"""
         try:
             # 获取基本信息
-            stocks = self.fetcher.fetch_stocks()
-            stock = next((s for s in stocks if s.get('code') == code), None)
+            stock = self.fetcher.fetch_stocks_by_code().get(code)
 
             if not stock:
                 return jsonify({'code': 404, 'message': '股票不存在'}), 404
 
-            # 获取日线数据
+            # 列表结果来自缓存，转换为新字典后再补充行情字段
+            stock = asdict(stock)
+
+            # 获取日线数据（从缓存的全市场行情中按代码查找）
             try:
-                daily_data = self.fetcher.fetch_daily_data(code)
-                if daily_data:
-                    latest = daily_data[0] if isinstance(daily_data, list) and daily_data else daily_data
+                latest = self.fetcher.fetch_daily_data_by_code().get(code)
+                if latest:
                     stock.update({
                         'price': latest.get('close'),
-                        'price_change': latest.get('pct_chg'),
-                        'volume': latest.get('vol'),
-                        'amount': latest.get('amount'),
+                        'price_change': latest.get('change_percent'),
+                        'volume': latest.get('volume'),
+                        'amount': latest.get('turnover'),
                         'trade_date': latest.get('trade_date')
                     })
             except Exception as de:
                 logger.warning(f"获取日线数据失败: {de}")
 
-            return jsonify({
-                'code': 200,
-                'message': 'success',
-                'data': stock,
-                'timestamp': datetime.now().isoformat()
-            })
+            return _success(stock)
         except Exception as e:
             logger.error(f"获取股票详情失败: {e}")
             return jsonify({'code': 500, 'message': str(e)}), 500
@@ -156,12 +136,7 @@ class StockController:
         try:
             financial_data = self.fetcher.fetch_financial_data(code)
 
-            return jsonify({
-                'code': 200,
-                'message': 'success',
-                'data': financial_data,
-                'timestamp': datetime.now().isoformat()
-            })
+            return _success(financial_data)
         except Exception as e:
             logger.error(f"获取财务数据失败: {e}")
             return jsonify({'code': 500, 'message': str(e)}), 500
@@ -186,15 +161,10 @@ class StockController:
                 'pe_ratio': latest_financial.get('pe'),
                 'pb_ratio': latest_financial.get('pb'),
                 'roe': latest_financial.get('roe'),
-                'analysis_date': datetime.now().isoformat()
+                'analysis_date': date.today().isoformat()
             }
 
-            return jsonify({
-                'code': 200,
-                'message': 'success',
-                'data': valuation,
-                'timestamp': datetime.now().isoformat()
-            })
+            return _success(valuation)
         except Exception as e:
             logger.error(f"获取估值分析失败: {e}")
             return jsonify({'code': 500, 'message': str(e)}), 500
@@ -203,31 +173,23 @@ class StockController:
         """筛选股票"""
         try:
             filters = request.json or {}
-            stocks = self.fetcher.fetch_stocks()
 
             # TODO: 实现更复杂的筛选逻辑
-            filtered = stocks
-
             if 'market' in filters:
                 market = filters['market'].upper()
-                filtered = [s for s in filtered if s.get('market') == market]
+                filtered = self.fetcher.fetch_stocks_by_market().get(market, ())
+            else:
+                filtered = self.fetcher.fetch_stocks()
 
-            return jsonify({
-                'code': 200,
-                'message': 'success',
-                'data': filtered[:100]  # 限制返回数量
-            })
+            return _success(filtered[:100])  # 限制返回数量
         except Exception as e:
             logger.error(f"筛选股票失败: {e}")
             return jsonify({'code': 500, 'message': str(e)}), 500
 
 
-class AnalysisController:
+class AnalysisController(BaseController):
     """分析控制器"""
 
-    def __init__(self):
-        self.fetcher = DataFetcher()
-
     def get_recommendations(self):
         """获取推荐股票列表"""
         try:
@@ -240,12 +202,7 @@ class AnalysisController:
             # 目前返回前N个股票
             recommendations = stocks[:top_n]
 
-            return jsonify({
-                'code': 200,
-                'message': 'success',
-                'data': recommendations,
-                'timestamp': datetime.now().isoformat()
-            })
+            return _success(recommendations)
         except Exception as e:
             logger.error(f"获取推荐列表失败: {e}")
             return jsonify({'code': 500, 'message': str(e)}), 500
@@ -271,15 +228,10 @@ class AnalysisController:
                 'pb_ratio': latest_financial.get('pb'),
                 'roe': latest_financial.get('roe'),
                 'graham_score': 0,  # TODO: 实现评分算法
-                'analysis_date': datetime.now().isoformat()
+                'analysis_date': date.today().isoformat()
             }
 
-            return jsonify({
-                'code': 200,
-                'message': 'success',
-                'data': analysis,
-                'timestamp': datetime.now().isoformat()
-            })
+            return _success(analysis)
         except Exception as e:
             logger.error(f"获取格雷厄姆分析失败: {e}")
             return jsonify({'code': 500, 'message': str(e)}), 500
@@ -303,11 +255,7 @@ class TaskController:
     def get_task_status(self, task_id):
         """获取任务状态（已废弃，保留接口兼容性）"""
         try:
-            return jsonify({
-                'code': 200,
-                'message': 'success',
-                'data': {'task_id': task_id, 'status': 'deprecated'}
-            })
+            return _success({'task_id': task_id, 'status': 'deprecated'})
         except Exception as e:
             logger.error(f"获取任务状态失败: {e}")
             return jsonify({'code': 500, 'message': str(e)}), 500
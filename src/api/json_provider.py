@@ -0,0 +1,57 @@
+"""Flask JSON序列化（优先使用orjson）"""
+from datetime import date
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # 未安装orjson时退回标准库json
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _default(obj: Any) -> Any:
+    """序列化orjson/json无法直接处理的对象"""
+    if np is not None:
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+    if isinstance(obj, date):
+        return obj.isoformat()
+    return DefaultJSONProvider.default(obj)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    基于orjson的JSON序列化
+
+    - 中文不转义、不排序键（对应原 JSON_AS_ASCII / JSON_SORT_KEYS 配置）
+    - 日期统一输出为ISO格式，NumPy数组与标量可直接返回
+    """
+
+    ensure_ascii = False
+    sort_keys = False
+
+    if orjson is not None:
+        _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, default=_default, option=self._OPTIONS).decode()
+
+        def loads(self, s, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+
+        def response(self, *args: Any, **kwargs: Any):
+            obj = self._prepare_response_obj(args, kwargs)
+            return self._app.response_class(
+                orjson.dumps(obj, default=_default, option=self._OPTIONS),
+                mimetype=self.mimetype
+            )
+    else:
+        default = staticmethod(_default)
@@ -1,5 +1,7 @@
 """API路由定义"""
-from flask import Blueprint
+import hashlib
+
+from flask import Blueprint, request
 from .controllers import (
     industry_controller,
     stock_controller,
@@ -7,6 +9,20 @@ from .controllers import (
     task_controller
 )
 
+# GET响应的客户端缓存时间（秒）
+CACHE_MAX_AGE = 60
+
+
+def add_etag(response):
+    """为GET请求的成功响应添加ETag，客户端内容未变化时返回304"""
+    if request.method != 'GET' or response.status_code != 200 or response.direct_passthrough:
+        return response
+
+    response.set_etag(hashlib.md5(response.get_data()).hexdigest())
+    response.headers['Cache-Control'] = f'private, max-age={CACHE_MAX_AGE}'
+
+    return response.make_conditional(request)
+
 
 def register_routes(app):
     """注册所有路由"""
@@ -42,6 +58,9 @@ def register_routes(app):
     app.register_blueprint(analysis_bp, url_prefix=api_prefix)
     app.register_blueprint(task_bp, url_prefix=api_prefix)
 
+    # 条件请求（ETag/304）
+    app.after_request(add_etag)
+
     # 健康检查
     @app.route('/health')
     def health_check():
@@ -1,5 +1,6 @@
 """数据源模块"""
-from .tushare_api import TushareClient
-from .data_fetcher import DataFetcher
+from .tushare_api import TushareClient, get_default_client
+from .data_fetcher import DataFetcher, get_default_fetcher
+from .records import StockRecord
 
-__all__ = ['TushareClient', 'DataFetcher']
+__all__ = ['TushareClient', 'get_default_client', 'DataFetcher', 'get_default_fetcher', 'StockRecord']
@@ -0,0 +1,127 @@
+"""进程内TTL缓存 - 缓存DataFetcher的转换结果，避免重复调用Tushare"""
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import wraps
+from typing import Any, Dict, List
+
+# 已注册的缓存函数，用于统一清理和统计
+_registry: List[Any] = []
+
+
+def _freeze(value: Any) -> Any:
+    """将列表/字典等不可哈希参数转换为可哈希的缓存键"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def ttl_cache(ttl: float, maxsize: int = 128):
+    """
+    带过期时间的LRU缓存装饰器
+
+    Args:
+        ttl: 缓存有效期（秒）
+        maxsize: 最多缓存的结果数量
+
+    被装饰的函数提供 cache_clear() 和 cache_info() 方法
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        entries: 'OrderedDict[Any, tuple]' = OrderedDict()
+        # 正在计算中的键 -> Future，同一键并发未命中时只由一个线程调用func，其余线程等待其结果
+        pending: Dict[Any, Future] = {}
+        lock = threading.Lock()
+        counters = {'hits': 0, 'misses': 0, 'generation': 0}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # 按函数签名绑定参数并补全默认值，f()、f(None)、f(x=None) 等等价调用使用同一个缓存键
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _freeze(tuple(bound.arguments.items()))
+            now = time.monotonic()
+
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(key)
+                    counters['hits'] += 1
+                    return entry[1]
+
+                future = pending.get(key)
+                leader = future is None
+                if leader:
+                    future = pending[key] = Future()
+                    counters['misses'] += 1
+                    generation = counters['generation']
+                else:
+                    counters['hits'] += 1
+
+            if not leader:
+                return future.result()
+
+            # 在锁外调用，避免慢请求阻塞其他参数的查询
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    if pending.get(key) is future:
+                        del pending[key]
+                future.set_exception(e)
+                raise
+
+            with lock:
+                if pending.get(key) is future:
+                    del pending[key]
+                # 空结果不缓存，避免接口短暂失败后在整个有效期内返回空数据；
+                # 计算期间缓存被清空时也不写入旧结果
+                if result and generation == counters['generation']:
+                    entries[key] = (now + ttl, result)
+                    entries.move_to_end(key)
+                    while len(entries) > maxsize:
+                        entries.popitem(last=False)
+            future.set_result(result)
+
+            return result
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+                pending.clear()
+                counters['hits'] = counters['misses'] = 0
+                counters['generation'] += 1
+
+        def cache_info() -> Dict[str, Any]:
+            with lock:
+                return {
+                    'name': func.__qualname__,
+                    'hits': counters['hits'],
+                    'misses': counters['misses'],
+                    'size': len(entries),
+                    'maxsize': maxsize,
+                    'ttl': ttl
+                }
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_info = cache_info
+        _registry.append(wrapper)
+        return wrapper
+    return decorator
+
+
+def clear():
+    """清空所有TTL缓存"""
+    for func in _registry:
+        func.cache_clear()
+
+
+def stats() -> List[Dict[str, Any]]:
+    """获取所有TTL缓存的命中统计"""
+    return [func.cache_info() for func in _registry]
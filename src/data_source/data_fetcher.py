@@ -1,28 +1,96 @@
 """数据获取统一接口 - 将Tushare数据转换为字典格式"""
-from typing import List, Optional
+import heapq
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, date
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 import pandas as pd
 
-from src.data_source.tushare_api import TushareClient
+from src.data_source.cache import ttl_cache
+from src.data_source.disk_cache import DiskCache
+from src.data_source.records import StockRecord
+from src.data_source.tushare_api import TushareClient, get_default_client
+from src.utils.config import config
 from src.utils.logger import logger
 
 
+# 各接口的缓存有效期（秒）
+CACHE_TTL = {
+    'fetch_stocks': 3600,  # 股票列表当日基本不变
+    'fetch_daily_data': 60,  # 盘中行情
+    'fetch_financial_data': 86400,  # 财务数据按季度更新
+    'fetch_industries': 300,
+}
+
+# 磁盘缓存有效期（秒）：进程重启后仍可复用变化缓慢的数据
+DISK_CACHE_TTL = {
+    'stock_list': 86400,  # 上市股票列表每日最多变化一次
+    'industry_list': 30 * 86400,  # 行业分类按月更新快照
+    'trade_calendar': 7 * 86400,  # 交易日历全年公布，偶有临时休市调整
+    # 指定报告期的报表基本不再变化，最新一期需及时更新
+    'statement_period': 30 * 86400,
+    'statement_latest': 86400,
+}
+
+# 财务数据字段：报表 -> {Tushare字段: 系统字段}
+FINANCIAL_FIELDS = {
+    # 利润表数据
+    'income': {
+        'total_revenue': 'total_revenue',
+        'revenue_yoy': 'revenue_yoy',
+        'n_income': 'net_profit',
+        'n_income_yoy': 'net_profit_yoy',
+    },
+    # 资产负债表数据
+    'balance': {
+        'total_assets': 'total_assets',
+        'total_liab': 'total_liabilities',
+        'total_hldr_eqy_exc_min_int': 'net_assets',
+    },
+    # 现金流数据
+    'cashflow': {
+        'n_cashflow_act': 'operating_cash_flow',
+        'n_cashflow_inv_act': 'investing_cash_flow',
+        'n_cash_flows_fnc_act': 'financing_cash_flow',
+    },
+    # 财务指标与比率
+    'indicator': {
+        'eps': 'eps',
+        'grossprofit_margin': 'gross_margin',
+        'netprofit_margin': 'net_margin',
+        'debt_to_assets': 'debt_ratio',
+        'current_ratio': 'current_ratio',
+        'quick_ratio': 'quick_ratio',
+        'roe': 'roe',
+        'roa': 'roa',
+        'bps': 'bvps',
+        'undist_profit_ps': 'undistributed_profit_per_share',
+    },
+}
+
+# 行业行情并发请求的线程数（网络I/O等待为主）
+INDUSTRY_FETCH_WORKERS = 16
+
+
 class DataFetcher:
     """数据获取统一接口"""
 
-    def __init__(self, tushare_client: TushareClient = None):
+    def __init__(self, tushare_client: TushareClient = None, disk_cache: DiskCache = None):
         """
         初始化DataFetcher
 
         Args:
-            tushare_client: TushareClient实例，如果不提供则创建新实例
+            tushare_client: TushareClient实例，如果不提供则使用共享实例
+            disk_cache: 磁盘缓存，如果不提供则使用 data/cache/tushare.sqlite
         """
-        self.ts_client = tushare_client or TushareClient()
+        self.ts_client = tushare_client or get_default_client()
+        self.disk_cache = disk_cache or DiskCache(config.get_data_path('cache') / 'tushare.sqlite')
         logger.info("DataFetcher初始化成功")
 
     # ==================== 股票基础数据 ====================
 
-    def fetch_stocks(self, market: str = None) -> List[dict]:
+    @ttl_cache(CACHE_TTL['fetch_stocks'], maxsize=8)
+    def fetch_stocks(self, market: str = None) -> Tuple[StockRecord, ...]:
         """
         获取股票列表
 
@@ -30,45 +98,89 @@ class DataFetcher:
             market: 市场类型 ('SZ', 'SH', None表示全部)
 
         Returns:
-            股票数据字典列表
+            股票记录元组（结果会被缓存并在请求间共享，返回不可变的元组）
         """
         logger.info(f"开始获取股票列表，市场: {market or '全部'}")
 
         # 获取Tushare数据
-        df = self.ts_client.get_stock_list(market=market)
+        df = self._fetch_cached(
+            self.ts_client.get_stock_list, market or 'all', DISK_CACHE_TTL['stock_list'], market=market
+        )
 
         if df is None or df.empty:
             logger.warning("未获取到股票数据")
-            return []
+            return ()
+
+        # 转换为系统格式（按列向量化转换股票代码与上市日期）
+        codes, markets = self.ts_client.split_ts_codes(df['ts_code'])
+        stocks_df = pd.DataFrame({
+            'code': codes,
+            'name': self._text_column(df, 'name'),
+            'market': markets,
+            'industry_code': self._text_column(df, 'industry'),  # 暂时使用industry字段
+            'list_date': self._date_column(df, 'list_date') if 'list_date' in df.columns else None,
+            # Tushare没有直接提供股本数据，需要额外获取
+            'total_shares': None,
+            'circulating_shares': None
+        }, index=df.index)
+        stocks = [StockRecord(*values) for values in stocks_df.itertuples(index=False, name=None)]
 
-        # 转换为系统格式
-        stocks = []
-        for _, row in df.iterrows():
-            try:
-                # 转换股票代码格式
-                code, market_code = self.ts_client.convert_from_ts_code(row['ts_code'])
-
-                stock_data = {
-                    'code': code,
-                    'name': row.get('name', ''),
-                    'market': market_code,
-                    'industry_code': row.get('industry', ''),  # 暂时使用industry字段
-                    'list_date': self._parse_date(row.get('list_date')),
-                    # Tushare没有直接提供股本数据，需要额外获取
-                    'total_shares': None,
-                    'circulating_shares': None
-                }
-                stocks.append(stock_data)
+        logger.info(f"获取股票列表成功，共{len(stocks)}条")
+        return tuple(stocks)
 
-            except Exception as e:
-                logger.warning(f"转换股票数据失败: {row.get('ts_code')}, 错误: {e}")
-                continue
+    @ttl_cache(CACHE_TTL['fetch_stocks'], maxsize=8)
+    def fetch_stocks_by_code(self, market: str = None) -> Dict[str, StockRecord]:
+        """
+        获取按股票代码索引的股票字典
 
-        logger.info(f"获取股票列表成功，共{len(stocks)}条")
-        return stocks
+        Args:
+            market: 市场类型 ('SZ', 'SH', None表示全部)
+
+        Returns:
+            股票代码到股票数据的字典
+        """
+        return {stock.code: stock for stock in self.fetch_stocks(market=market)}
+
+    @ttl_cache(CACHE_TTL['fetch_stocks'], maxsize=1)
+    def fetch_stocks_by_market(self) -> Dict[str, Tuple[StockRecord, ...]]:
+        """
+        获取按市场分组的股票列表（基于全市场列表分组，不额外调用Tushare）
+
+        Returns:
+            市场代码到股票数据元组的字典
+        """
+        groups: Dict[str, List[StockRecord]] = {}
+        for stock in self.fetch_stocks():
+            groups.setdefault(stock.market, []).append(stock)
+        return {market: tuple(stocks) for market, stocks in groups.items()}
+
+    # ==================== 交易日历 ====================
+
+    def fetch_open_days(self, year: int) -> frozenset:
+        """
+        获取某年的开市日期
+
+        Args:
+            year: 年份
+
+        Returns:
+            开市日期集合 {'YYYYMMDD', ...}，未获取到时为空集合
+        """
+        df = self._fetch_cached(
+            self.ts_client.get_trade_calendar, str(year), DISK_CACHE_TTL['trade_calendar'],
+            f"{year}0101", f"{year}1231"
+        )
+
+        if df is None or df.empty:
+            logger.warning(f"未获取到交易日历: {year}")
+            return frozenset()
+
+        is_open = pd.to_numeric(df['is_open'], errors='coerce') == 1
+        return frozenset(df.loc[is_open, 'cal_date'].astype(str))
 
     # ==================== 日线行情数据 ====================
 
+    @ttl_cache(CACHE_TTL['fetch_daily_data'], maxsize=32)
     def fetch_daily_data(self, stock_codes: List[str] = None, trade_date: str = None) -> List[dict]:
         """
         获取日线行情数据
@@ -95,59 +207,79 @@ class DataFetcher:
             logger.warning("未获取到日线行情数据")
             return []
 
-        # 合并数据
+        # 合并数据（每日指标中与行情重复的列，如close，以行情为准）
         if basic_df is not None and not basic_df.empty:
-            merged_df = pd.merge(daily_df, basic_df, on=['ts_code', 'trade_date'], how='left')
+            dup_columns = basic_df.columns.intersection(daily_df.columns)
+            trade_dates = set(daily_df['trade_date'].unique()) | set(basic_df['trade_date'].unique())
+            if len(trade_dates) == 1:
+                # 单日数据的trade_date为常量，直接按ts_code索引连接
+                basic = basic_df.set_index('ts_code').drop(columns=dup_columns.drop('ts_code'))
+                merged_df = daily_df.join(basic, on='ts_code')
+            else:
+                basic = basic_df.drop(columns=dup_columns.drop(['ts_code', 'trade_date']))
+                merged_df = pd.merge(daily_df, basic, on=['ts_code', 'trade_date'], how='left')
         else:
             merged_df = daily_df
 
-        # 转换为系统格式
-        daily_data_list = []
-        for _, row in merged_df.iterrows():
-            try:
-                code, market = self.ts_client.convert_from_ts_code(row['ts_code'])
+        # 拆分股票代码（向量化，替代逐行convert_from_ts_code）
+        codes, _ = self.ts_client.split_ts_codes(merged_df['ts_code'])
+
+        # 如果指定了股票代码列表，先过滤再转换
+        if stock_codes:
+            if isinstance(stock_codes, str):
+                stock_codes = [stock_codes]
+            mask = codes.isin(stock_codes)
+            merged_df, codes = merged_df[mask], codes[mask]
+
+        col = partial(self._float_column, merged_df)
+        high, low, pre_close = col('high'), col('low'), col('pre_close')
+        vol, amount = col('vol'), col('amount')
+        total_mv, circ_mv = col('total_mv'), col('circ_mv')
+
+        # 转换为系统格式（0值与缺失值一样视为无数据）
+        daily_df_out = pd.DataFrame({
+            'stock_code': codes,
+            'trade_date': self._date_column(merged_df, 'trade_date'),
+            'open': col('open'),
+            'high': high,
+            'low': low,
+            'close': col('close'),
+            'volume': (vol * 100).where(vol != 0),  # Tushare单位是手，转为股
+            'turnover': (amount * 1000).where(amount != 0),  # Tushare单位是千元，转为元
+            'change_percent': col('pct_chg'),
+            'change_amount': col('change'),
+            # Tushare没有直接提供振幅，按 (最高-最低)/昨收 计算
+            'amplitude': ((high - low) / pre_close * 100).where(
+                (high != 0) & (low != 0) & (pre_close > 0)
+            ),
+            'turnover_rate': col('turnover_rate'),
+            'volume_ratio': None,  # 需要额外计算
+            'pe_ratio': col('pe'),
+            'pb_ratio': col('pb'),
+            'total_market_cap': (total_mv * 10000).where(total_mv != 0),  # 万元转元
+            'circulating_market_cap': (circ_mv * 10000).where(circ_mv != 0)
+        })
+        daily_data_list = daily_df_out.astype(object).where(daily_df_out.notna(), None).to_dict('records')
 
-                # 如果指定了股票代码列表，进行过滤
-                if stock_codes and code not in stock_codes:
-                    continue
+        logger.info(f"获取日线行情成功，共{len(daily_data_list)}条")
+        return daily_data_list
 
-                daily_data = {
-                    'stock_code': code,
-                    'trade_date': self._parse_date(row.get('trade_date')),
-                    'open': self._safe_float(row.get('open')),
-                    'high': self._safe_float(row.get('high')),
-                    'low': self._safe_float(row.get('low')),
-                    'close': self._safe_float(row.get('close')),
-                    'volume': self._safe_float(row.get('vol')) * 100 if row.get('vol') else None,  # Tushare单位是手，转为股
-                    'turnover': self._safe_float(row.get('amount')) * 1000 if row.get('amount') else None,  # Tushare单位是千元，转为元
-                    'change_percent': self._safe_float(row.get('pct_chg')),
-                    'change_amount': self._safe_float(row.get('change')),
-                    'amplitude': None,  # Tushare没有直接提供，可以计算
-                    'turnover_rate': self._safe_float(row.get('turnover_rate')),
-                    'volume_ratio': None,  # 需要额外计算
-                    'pe_ratio': self._safe_float(row.get('pe')),
-                    'pb_ratio': self._safe_float(row.get('pb')),
-                    'total_market_cap': self._safe_float(row.get('total_mv')) * 10000 if row.get('total_mv') else None,  # 万元转元
-                    'circulating_market_cap': self._safe_float(row.get('circ_mv')) * 10000 if row.get('circ_mv') else None
-                }
-
-                # 计算振幅
-                if daily_data['high'] and daily_data['low'] and row.get('pre_close'):
-                    pre_close = self._safe_float(row.get('pre_close'))
-                    if pre_close and pre_close > 0:
-                        daily_data['amplitude'] = ((daily_data['high'] - daily_data['low']) / pre_close) * 100
-
-                daily_data_list.append(daily_data)
+    @ttl_cache(CACHE_TTL['fetch_daily_data'], maxsize=8)
+    def fetch_daily_data_by_code(self, trade_date: str = None) -> Dict[str, dict]:
+        """
+        获取按股票代码索引的全市场日线行情（各股票共用一次全市场拉取）
 
-            except Exception as e:
-                logger.warning(f"转换日线数据失败: {row.get('ts_code')}, 错误: {e}")
-                continue
+        Args:
+            trade_date: 交易日期 '2025-01-04' 或 '20250104'
 
-        logger.info(f"获取日线行情成功，共{len(daily_data_list)}条")
-        return daily_data_list
+        Returns:
+            股票代码到日线行情的字典
+        """
+        return {daily['stock_code']: daily for daily in self.fetch_daily_data(trade_date=trade_date)}
 
     # ==================== 财务数据 ====================
 
+    @ttl_cache(CACHE_TTL['fetch_financial_data'], maxsize=1024)
     def fetch_financial_data(self, stock_code: str, market: str = 'SH', period: str = None) -> Optional[dict]:
         """
         获取财务数据
@@ -165,62 +297,55 @@ class DataFetcher:
         ts_code = self.ts_client.convert_to_ts_code(stock_code, market)
 
         try:
-            # 获取各类财务数据
-            income_df = self.ts_client.get_income_statement(ts_code, period=period)
-            balance_df = self.ts_client.get_balance_sheet(ts_code, period=period)
-            cashflow_df = self.ts_client.get_cash_flow(ts_code, period=period)
-            indicator_df = self.ts_client.get_financial_indicator(ts_code, period=period)
+            # 并发获取各类财务数据
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [
+                    executor.submit(self._fetch_statement, method, ts_code, period)
+                    for method in (
+                        self.ts_client.get_income_statement,
+                        self.ts_client.get_balance_sheet,
+                        self.ts_client.get_cash_flow,
+                        self.ts_client.get_financial_indicator,
+                    )
+                ]
+                income_df, balance_df, cashflow_df, indicator_df = [f.result() for f in futures]
 
             # 取最新一期数据
-            income_row = income_df.iloc[0] if income_df is not None and not income_df.empty else None
-            balance_row = balance_df.iloc[0] if balance_df is not None and not balance_df.empty else None
-            cashflow_row = cashflow_df.iloc[0] if cashflow_df is not None and not cashflow_df.empty else None
-            indicator_row = indicator_df.iloc[0] if indicator_df is not None and not indicator_df.empty else None
+            statements = {
+                'income': income_df,
+                'balance': balance_df,
+                'cashflow': cashflow_df,
+                'indicator': indicator_df,
+            }
+            latest = {
+                name: df.iloc[0] for name, df in statements.items()
+                if df is not None and not df.empty
+            }
 
-            if income_row is None and balance_row is None and indicator_row is None:
+            if not latest.keys() & {'income', 'balance', 'indicator'}:
                 logger.warning(f"未获取到财务数据: {stock_code}")
                 return None
 
+            report_row = latest.get('income', latest.get('balance', latest.get('indicator')))
+
+            # 每张报表的所需字段一次性转换为数值，缺失或无法转换时为None
+            values = {}
+            for name, fields in FINANCIAL_FIELDS.items():
+                row = latest.get(name)
+                if row is None:
+                    values.update(dict.fromkeys(fields.values()))
+                    continue
+                numeric = pd.to_numeric(row.reindex(list(fields)), errors='coerce')
+                values.update(
+                    (target, None if pd.isna(numeric[source]) else float(numeric[source]))
+                    for source, target in fields.items()
+                )
+
             # 合并数据
             financial_data = {
                 'stock_code': stock_code,
-                'report_date': self._parse_date(
-                    income_row.get('end_date') if income_row is not None else
-                    balance_row.get('end_date') if balance_row is not None else
-                    indicator_row.get('end_date')
-                ),
-
-                # 利润表数据
-                'total_revenue': self._safe_float(income_row.get('total_revenue') if income_row is not None else None),
-                'revenue_yoy': self._safe_float(income_row.get('revenue_yoy') if income_row is not None else None),
-                'net_profit': self._safe_float(income_row.get('n_income') if income_row is not None else None),
-                'net_profit_yoy': self._safe_float(income_row.get('n_income_yoy') if income_row is not None else None),
-
-                # 财务指标
-                'eps': self._safe_float(indicator_row.get('eps') if indicator_row is not None else None),
-                'gross_margin': self._safe_float(indicator_row.get('grossprofit_margin') if indicator_row is not None else None),
-                'net_margin': self._safe_float(indicator_row.get('netprofit_margin') if indicator_row is not None else None),
-
-                # 资产负债表数据
-                'total_assets': self._safe_float(balance_row.get('total_assets') if balance_row is not None else None),
-                'total_liabilities': self._safe_float(balance_row.get('total_liab') if balance_row is not None else None),
-                'net_assets': self._safe_float(balance_row.get('total_hldr_eqy_exc_min_int') if balance_row is not None else None),
-
-                # 财务比率
-                'debt_ratio': self._safe_float(indicator_row.get('debt_to_assets') if indicator_row is not None else None),
-                'current_ratio': self._safe_float(indicator_row.get('current_ratio') if indicator_row is not None else None),
-                'quick_ratio': self._safe_float(indicator_row.get('quick_ratio') if indicator_row is not None else None),
-
-                # 现金流数据
-                'operating_cash_flow': self._safe_float(cashflow_row.get('n_cashflow_act') if cashflow_row is not None else None),
-                'investing_cash_flow': self._safe_float(cashflow_row.get('n_cashflow_inv_act') if cashflow_row is not None else None),
-                'financing_cash_flow': self._safe_float(cashflow_row.get('n_cash_flows_fnc_act') if cashflow_row is not None else None),
-
-                # 重要指标
-                'roe': self._safe_float(indicator_row.get('roe') if indicator_row is not None else None),
-                'roa': self._safe_float(indicator_row.get('roa') if indicator_row is not None else None),
-                'bvps': self._safe_float(indicator_row.get('bps') if indicator_row is not None else None),
-                'undistributed_profit_per_share': self._safe_float(indicator_row.get('undist_profit_ps') if indicator_row is not None else None)
+                'report_date': self._parse_date(report_row.get('end_date')),
+                **values
             }
 
             logger.info(f"获取财务数据成功: {stock_code}")
@@ -230,8 +355,44 @@ class DataFetcher:
             logger.error(f"获取财务数据失败: {stock_code}, 错误: {e}")
             return None
 
+    @ttl_cache(CACHE_TTL['fetch_financial_data'], maxsize=8)
+    def fetch_financial_indicators(self, period: str) -> Dict[str, dict]:
+        """
+        获取全市场某一报告期的财务指标（一次请求，替代逐个股票调用fetch_financial_data）
+
+        Args:
+            period: 报告期 '20231231'
+
+        Returns:
+            股票代码到财务指标字典的字典
+        """
+        logger.info(f"开始获取全市场财务指标: {period}")
+
+        df = self._fetch_cached(
+            self.ts_client.get_financial_indicator_by_period, period,
+            DISK_CACHE_TTL['statement_period'], period
+        )
+
+        if df is None or df.empty:
+            logger.warning(f"未获取到全市场财务指标: {period}")
+            return {}
+
+        # 同一股票可能有多条（更正公告），保留接口返回的第一条
+        df = df.drop_duplicates('ts_code')
+        fields = FINANCIAL_FIELDS['indicator']
+        indicators = pd.DataFrame(
+            {target: self._float_column(df, source) for source, target in fields.items()}
+        )
+        indicators.insert(0, 'stock_code', self.ts_client.split_ts_codes(df['ts_code'])[0])
+        indicators.insert(1, 'report_date', self._date_column(df, 'end_date'))
+        records = indicators.astype(object).where(indicators.notna(), None).to_dict('records')
+
+        logger.info(f"获取全市场财务指标成功，共{len(records)}条")
+        return {record['stock_code']: record for record in records}
+
     # ==================== 行业数据 ====================
 
+    @ttl_cache(CACHE_TTL['fetch_industries'], maxsize=32)
     def fetch_industries(self, trade_date: str = None) -> List[dict]:
         """
         获取行业数据
@@ -246,7 +407,11 @@ class DataFetcher:
 
         try:
             # 获取申万一级行业列表
-            industry_list_df = self.ts_client.get_industry_index_list(src='SW2021')
+            # 行业分类数月才调整一次，按月份保存快照，月份变化时重新获取
+            industry_list_df = self._fetch_cached(
+                self.ts_client.get_industry_index_list, f"SW2021:{date.today():%Y%m}",
+                DISK_CACHE_TTL['industry_list'], src='SW2021'
+            )
 
             if industry_list_df is None or industry_list_df.empty:
                 logger.warning("未获取到行业列表")
@@ -258,50 +423,145 @@ class DataFetcher:
             else:
                 ts_trade_date = datetime.now().strftime('%Y%m%d')
 
-            industries = []
+            # 并发获取每个行业的行情数据
+            rows = industry_list_df.to_dict('records')
+            with ThreadPoolExecutor(max_workers=min(INDUSTRY_FETCH_WORKERS, len(rows))) as executor:
+                results = executor.map(partial(self._fetch_industry, trade_date=ts_trade_date), rows)
+                industries = [industry for industry in results if industry is not None]
 
-            # 获取每个行业的行情数据
-            for _, row in industry_list_df.iterrows():
-                try:
-                    index_code = row.get('index_code')
-                    industry_name = row.get('industry_name')
+            logger.info(f"获取行业数据成功，共{len(industries)}条")
+            return industries
 
-                    # 获取行业指数当日行情
-                    index_daily_df = self.ts_client.get_industry_index_daily(
-                        ts_code=index_code,
-                        start_date=ts_trade_date,
-                        end_date=ts_trade_date
-                    )
+        except Exception as e:
+            logger.error(f"获取行业数据失败: {e}")
+            return []
 
-                    if index_daily_df is None or index_daily_df.empty:
-                        continue
+    @ttl_cache(CACHE_TTL['fetch_industries'], maxsize=32)
+    def fetch_industries_by_code(self, trade_date: str = None) -> Dict[str, dict]:
+        """
+        获取按行业代码索引的行业字典
 
-                    daily_row = index_daily_df.iloc[0]
+        Args:
+            trade_date: 交易日期 '2025-01-04'
 
-                    industry_data = {
-                        'code': index_code,
-                        'name': industry_name,
-                        'price_change': self._safe_float(daily_row.get('pct_chg')),
-                        'volume': self._safe_float(daily_row.get('vol')),
-                        'turnover': self._safe_float(daily_row.get('amount')),
-                        'pe_ratio': None,  # 行业指数没有PE数据，需要自行计算
-                        'pb_ratio': None,  # 行业指数没有PB数据，需要自行计算
-                        'stock_count': 0,  # 需要额外统计
-                        'leading_stocks': '[]'
-                    }
+        Returns:
+            行业代码到行业数据的字典
+        """
+        return {industry['code']: industry for industry in self.fetch_industries(trade_date=trade_date)}
 
-                    industries.append(industry_data)
+    @ttl_cache(CACHE_TTL['fetch_industries'], maxsize=32)
+    def fetch_industry_ranking(self, top_n: int = 20, trade_date: str = None) -> List[dict]:
+        """
+        获取按涨跌幅排序的行业排名
 
-                except Exception as e:
-                    logger.warning(f"转换行业数据失败: {row.get('industry_name')}, 错误: {e}")
-                    continue
+        Args:
+            top_n: 返回前N个行业
+            trade_date: 交易日期 '2025-01-04'
 
-            logger.info(f"获取行业数据成功，共{len(industries)}条")
-            return industries
+        Returns:
+            行业数据字典列表（涨跌幅从高到低）
+        """
+        industries = self.fetch_industries(trade_date=trade_date)
+        # 缺失的涨跌幅按0处理
+        return heapq.nlargest(top_n, industries, key=lambda x: x.get('price_change') or 0)
+
+    def refresh_industries(self):
+        """清除行业分类快照和行业数据缓存，下次请求时重新获取"""
+        self.disk_cache.clear(self.ts_client.get_industry_index_list.__name__)
+        for cached in (self.fetch_industries, self.fetch_industries_by_code, self.fetch_industry_ranking):
+            cached.cache_clear()
+
+    def _fetch_statement(self, method, ts_code: str, period: str = None) -> Optional[pd.DataFrame]:
+        """
+        获取财务报表，优先读取磁盘缓存
+
+        Args:
+            method: TushareClient的报表获取方法
+            ts_code: Tushare格式代码
+            period: 报告期，None表示最新
+
+        Returns:
+            报表DataFrame
+        """
+        key = f"{ts_code}:{period or 'latest'}"
+        ttl = DISK_CACHE_TTL['statement_period' if period else 'statement_latest']
+        return self._fetch_cached(method, key, ttl, ts_code, period=period)
+
+    def _fetch_cached(self, method, key: str, ttl: float, *args, **kwargs) -> Optional[pd.DataFrame]:
+        """
+        调用Tushare接口，优先读取磁盘缓存，空结果不缓存
+
+        Args:
+            method: TushareClient的接口方法
+            key: 缓存键（同一接口内唯一标识参数）
+            ttl: 缓存有效期（秒）
+            *args: 接口方法的位置参数
+            **kwargs: 接口方法的关键字参数
 
+        Returns:
+            接口返回的DataFrame
+        """
+        endpoint = method.__name__
+
+        # 磁盘缓存只是加速手段，读写失败（如多进程共享时数据库被锁）不影响请求
+        try:
+            df = self.disk_cache.get(endpoint, key, ttl)
         except Exception as e:
-            logger.error(f"获取行业数据失败: {e}")
-            return []
+            logger.warning(f"读取磁盘缓存失败: {endpoint}/{key}: {e}")
+            df = None
+        if df is not None:
+            return df
+
+        df = method(*args, **kwargs)
+        if df is not None and not df.empty:
+            try:
+                self.disk_cache.set(endpoint, key, df)
+            except Exception as e:
+                logger.warning(f"写入磁盘缓存失败: {endpoint}/{key}: {e}")
+        return df
+
+    def _fetch_industry(self, row: dict, trade_date: str) -> Optional[dict]:
+        """
+        获取单个行业指数的当日行情
+
+        Args:
+            row: 行业列表中的一行
+            trade_date: Tushare格式交易日期
+
+        Returns:
+            行业数据字典，无行情或转换失败时返回None
+        """
+        try:
+            index_code = row.get('index_code')
+            industry_name = row.get('industry_name')
+
+            # 获取行业指数当日行情
+            index_daily_df = self.ts_client.get_industry_index_daily(
+                ts_code=index_code,
+                start_date=trade_date,
+                end_date=trade_date
+            )
+
+            if index_daily_df is None or index_daily_df.empty:
+                return None
+
+            daily_row = index_daily_df.iloc[0]
+
+            return {
+                'code': index_code,
+                'name': industry_name,
+                'price_change': self._safe_float(daily_row.get('pct_chg')),
+                'volume': self._safe_float(daily_row.get('vol')),
+                'turnover': self._safe_float(daily_row.get('amount')),
+                'pe_ratio': None,  # 行业指数没有PE数据，需要自行计算
+                'pb_ratio': None,  # 行业指数没有PB数据，需要自行计算
+                'stock_count': 0,  # 需要额外统计
+                'leading_stocks': '[]'
+            }
+
+        except Exception as e:
+            logger.warning(f"转换行业数据失败: {row.get('industry_name')}, 错误: {e}")
+            return None
 
     # ==================== 工具方法 ====================
 
@@ -338,6 +598,56 @@ class DataFetcher:
 
         return None
 
+    @staticmethod
+    def _float_column(df: pd.DataFrame, name: str) -> pd.Series:
+        """
+        取出数值列，无法转换的值与缺失列均记为NaN
+
+        Args:
+            df: 数据表
+            name: 列名
+
+        Returns:
+            float64列
+        """
+        if name not in df.columns:
+            return pd.Series(float('nan'), index=df.index)
+        return pd.to_numeric(df[name], errors='coerce').astype('float64')
+
+    @staticmethod
+    def _text_column(df: pd.DataFrame, name: str) -> pd.Series:
+        """
+        取出文本列，缺失值与缺失列均记为空字符串
+
+        Args:
+            df: 数据表
+            name: 列名
+
+        Returns:
+            文本列
+        """
+        if name not in df.columns:
+            return pd.Series('', index=df.index, dtype=object)
+        return df[name].fillna('')
+
+    @staticmethod
+    def _date_column(df: pd.DataFrame, name: str) -> pd.Series:
+        """
+        将Tushare日期列(YYYYMMDD)转换为date对象列，无法解析时为None
+
+        Args:
+            df: 数据表
+            name: 列名
+
+        Returns:
+            date对象列
+        """
+        parsed = pd.to_datetime(df[name].astype(str), format='%Y%m%d', errors='coerce')
+        return pd.Series(
+            [d.date() if d is not pd.NaT else None for d in parsed],
+            index=df.index, dtype=object
+        )
+
     @staticmethod
     def _safe_float(value) -> Optional[float]:
         """
@@ -375,3 +685,16 @@ class DataFetcher:
             return int(value)
         except (ValueError, TypeError):
             return None
+
+
+@lru_cache(maxsize=None)
+def get_default_fetcher() -> DataFetcher:
+    """
+    获取进程内共享的DataFetcher实例（首次调用时创建）
+
+    各控制器共用同一实例，TTL缓存和Tushare客户端不会按控制器分散
+
+    Returns:
+        DataFetcher实例
+    """
+    return DataFetcher()
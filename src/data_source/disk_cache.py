@@ -0,0 +1,92 @@
+"""磁盘缓存 - 使用SQLite持久化变化缓慢的Tushare数据，进程重启后仍可复用"""
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from src.utils.logger import logger
+
+
+class DiskCache:
+    """基于SQLite的键值缓存，按 (接口, 参数) 存储pickle序列化的数据"""
+
+    def __init__(self, path: Path):
+        """
+        初始化磁盘缓存
+
+        Args:
+            path: SQLite数据库文件路径
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " endpoint TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value BLOB NOT NULL,"
+            " inserted_at REAL NOT NULL,"
+            " PRIMARY KEY (endpoint, key))"
+        )
+        self._conn.commit()
+
+    def get(self, endpoint: str, key: str, ttl: float) -> Optional[Any]:
+        """
+        读取缓存
+
+        Args:
+            endpoint: 接口名称
+            key: 参数键
+            ttl: 有效期（秒）
+
+        Returns:
+            缓存的数据，不存在或已过期时返回None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, inserted_at FROM cache WHERE endpoint = ? AND key = ?",
+                (endpoint, key)
+            ).fetchone()
+
+        if row is None or time.time() - row[1] > ttl:
+            return None
+
+        try:
+            return pickle.loads(row[0])
+        except Exception as e:
+            logger.warning(f"读取磁盘缓存失败: {endpoint}/{key}, 错误: {e}")
+            return None
+
+    def set(self, endpoint: str, key: str, value: Any):
+        """
+        写入缓存
+
+        Args:
+            endpoint: 接口名称
+            key: 参数键
+            value: 要缓存的数据
+        """
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (endpoint, key, value, inserted_at) VALUES (?, ?, ?, ?)",
+                (endpoint, key, blob, time.time())
+            )
+            self._conn.commit()
+
+    def clear(self, endpoint: str = None):
+        """
+        清空缓存
+
+        Args:
+            endpoint: 只清空指定接口的缓存，None表示全部
+        """
+        with self._lock:
+            if endpoint is None:
+                self._conn.execute("DELETE FROM cache")
+            else:
+                self._conn.execute("DELETE FROM cache WHERE endpoint = ?", (endpoint,))
+            self._conn.commit()
@@ -0,0 +1,31 @@
+"""数据记录类型"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional
+
+
+@dataclass
+class StockRecord:
+    """
+    股票基础信息
+
+    使用 __slots__ 存储，全市场列表缓存时比字典占用更少内存；
+    序列化为JSON时与原字典格式一致
+    """
+
+    __slots__ = (
+        'code', 'name', 'market', 'industry_code', 'list_date',
+        'total_shares', 'circulating_shares',
+    )
+
+    code: str
+    name: str
+    market: Optional[str]
+    industry_code: str
+    list_date: Optional[date]
+    total_shares: Optional[float]
+    circulating_shares: Optional[float]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """按字段名取值，兼容字典式访问"""
+        return getattr(self, key, default)
@@ -1,8 +1,11 @@
 """Tushare数据源客户端"""
+import random
+import threading
 import time
 import pandas as pd
-from typing import Optional, List
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, List, Tuple
+from functools import lru_cache, wraps
 from src.utils.logger import logger
 
 try:
@@ -10,28 +13,108 @@ try:
 except ImportError:
     raise ImportError("请先安装tushare: pip install tushare")
 
+# 默认同时进行的最大请求数
+DEFAULT_MAX_CONCURRENCY = 20
 
-def rate_limit(calls_per_minute=200):
-    """API调用频率限制装饰器"""
-    min_interval = 60.0 / calls_per_minute
-    last_called = [0.0]
+# 默认接口调用频率限制(次/分钟)与允许的突发请求数
+DEFAULT_RATE_LIMIT = 200
+DEFAULT_RATE_BURST = 50
 
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            elapsed = time.time() - last_called[0]
-            wait_time = min_interval - elapsed
-            if wait_time > 0:
-                time.sleep(wait_time)
-            result = func(*args, **kwargs)
-            last_called[0] = time.time()
-            return result
-        return wrapper
-    return decorator
+# 行情数据中数值较大、需要保留float64精度的列（成交量、成交额、股本、市值）
+FLOAT64_QUOTE_COLUMNS = {
+    'vol', 'amount', 'total_share', 'float_share', 'free_share', 'total_mv', 'circ_mv'
+}
+
+# 重试等待时间上限（秒）
+RETRY_MAX_DELAY = 30
+# 调用频率超限时至少等待的时间（秒）
+RATE_LIMITED_RETRY_DELAY = 60.0 / DEFAULT_RATE_LIMIT
+# 错误信息包含这些关键字时不重试
+NON_RETRYABLE_KEYWORDS = ('权限', '参数', 'token')
+# 错误信息包含这些关键字时视为调用频率超限
+RATE_LIMIT_KEYWORDS = ('每分钟最多访问', '429', 'Too Many Requests')
+
+# 按报告期发布的财务报表接口 -> 报表名称
+PERIODIC_ENDPOINTS = {
+    'income': '利润表',
+    'balancesheet': '资产负债表',
+    'cashflow': '现金流量表',
+    'fina_indicator': '财务指标',
+}
+
+
+class TokenBucket:
+    """令牌桶限流器（线程安全，使用单调时钟，不受系统时间调整影响）"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数
+            capacity: 令牌桶容量，即空闲后允许的突发请求数
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, calls_per_minute: int, burst: int) -> 'TokenBucket':
+        """
+        按每分钟调用次数上限创建令牌桶
+
+        突发令牌也计入每分钟配额：突发用满后按剩余配额补充令牌，任意60秒内的调用不超过calls_per_minute
+
+        Args:
+            calls_per_minute: 每分钟最多调用次数
+            burst: 空闲后允许的突发请求数（限制在 1 ~ calls_per_minute-1 之间）
+
+        Returns:
+            令牌桶
+        """
+        burst = max(1, min(burst, calls_per_minute - 1))
+        return cls(rate=(calls_per_minute - burst) / 60.0, capacity=burst)
+
+    def acquire(self):
+        """获取一个令牌，令牌不足时等待"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # 令牌可以透支，等待者按到达顺序排队，在锁外等待
+            self.tokens -= 1
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+def rate_limit(func):
+    """API调用频率限制装饰器，使用客户端实例共享的令牌桶"""
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        self._rate_limiter.acquire()
+        return func(self, *args, **kwargs)
+    return wrapper
+
+
+def _is_retryable(error: Exception) -> bool:
+    """判断错误是否值得重试（参数、权限等错误重试也不会成功）"""
+    if isinstance(error, TypeError):
+        return False
+    message = str(error)
+    return not any(keyword in message for keyword in NON_RETRYABLE_KEYWORDS)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """判断错误是否为调用频率超限"""
+    message = str(error)
+    return any(keyword in message for keyword in RATE_LIMIT_KEYWORDS)
 
 
 def retry_on_error(max_retries=3, delay=1):
-    """错误重试装饰器"""
+    """错误重试装饰器（指数退避加随机抖动，避免并发请求同时重试）"""
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
@@ -39,10 +122,15 @@ def retry_on_error(max_retries=3, delay=1):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    if attempt == max_retries - 1:
+                    if attempt == max_retries - 1 or not _is_retryable(e):
                         raise
-                    logger.warning(f"API调用失败，{delay}秒后重试 ({attempt + 1}/{max_retries}): {e}")
-                    time.sleep(delay * (attempt + 1))
+                    wait_time = random.uniform(0, min(RETRY_MAX_DELAY, delay * 2 ** attempt))
+                    if _is_rate_limited(e):
+                        wait_time = max(wait_time, RATE_LIMITED_RETRY_DELAY)
+                    logger.warning(
+                        f"API调用失败，{wait_time:.1f}秒后重试 ({attempt + 1}/{max_retries}): {e}"
+                    )
+                    time.sleep(wait_time)
             return None
         return wrapper
     return decorator
@@ -51,28 +139,87 @@ def retry_on_error(max_retries=3, delay=1):
 class TushareClient:
     """Tushare数据源客户端"""
 
-    def __init__(self, token: str = None):
+    def __init__(self, token: str = None, max_concurrency: int = None):
         """
         初始化Tushare客户端
 
         Args:
             token: Tushare token，如果不提供则从配置文件读取
+            max_concurrency: 同时进行的最大请求数，如果不提供则从配置文件读取
         """
+        from src.utils.config import config
+
         if token is None:
-            from src.utils.config import config
             token = config.get('tushare.token')
 
         if not token:
             raise RuntimeError("Tushare token未配置，请提供token或在config/config.yaml中配置tushare.token")
 
+        if max_concurrency is None:
+            max_concurrency = config.get('tushare.max_concurrency', DEFAULT_MAX_CONCURRENCY)
+
+        calls_per_minute = config.get('tushare.rate_limit', DEFAULT_RATE_LIMIT)
+        burst = config.get('tushare.rate_burst', DEFAULT_RATE_BURST)
+
         ts.set_token(token)
         self.pro = ts.pro_api()
+        self.max_concurrency = max_concurrency
+        self._concurrency = threading.BoundedSemaphore(max_concurrency)
+        self._rate_limiter = TokenBucket.per_minute(calls_per_minute, burst)
         logger.info("Tushare客户端初始化成功")
 
+    def _query(self, api_name: str, **params) -> pd.DataFrame:
+        """
+        调用Tushare接口，限制同时进行的请求数
+
+        Args:
+            api_name: 接口名称，如 'daily'
+            **params: 接口参数
+
+        Returns:
+            接口返回的DataFrame
+        """
+        with self._concurrency:
+            return getattr(self.pro, api_name)(**params)
+
+    def map_codes(self, method: Callable[..., pd.DataFrame], ts_codes: Iterable[str],
+                  **kwargs) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        并发地对多个股票调用同一接口
+
+        请求在线程池中重叠等待，总吞吐量仍受rate_limit约束
+
+        Args:
+            method: 本客户端的接口方法，如 client.get_income_statement
+            ts_codes: Tushare格式代码列表
+            **kwargs: 传给接口方法的其他参数
+
+        Returns:
+            {ts_code: DataFrame}，失败的股票对应None
+        """
+        def fetch(ts_code):
+            try:
+                return method(ts_code, **kwargs)
+            except Exception as e:
+                logger.warning(f"批量获取失败: {method.__name__} {ts_code}, 错误: {e}")
+                return None
+
+        ts_codes = list(ts_codes)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            results = dict(zip(ts_codes, executor.map(fetch, ts_codes)))
+
+        succeeded = sum(df is not None for df in results.values())
+        logger.info(
+            f"批量获取完成: {method.__name__}，成功{succeeded}/{len(ts_codes)}，"
+            f"耗时{time.monotonic() - start:.1f}秒"
+        )
+        return results
+
     # ==================== 基础数据 ====================
 
     @retry_on_error(max_retries=3)
-    @rate_limit(calls_per_minute=200)
+    @rate_limit
     def get_stock_list(self, market: str = None) -> pd.DataFrame:
         """
         获取股票列表
@@ -91,12 +238,12 @@ class TushareClient:
             elif market.upper() == 'SH':
                 params['exchange'] = 'SSE'
 
-        df = self.pro.stock_basic(**params)
+        df = self._query('stock_basic', **params)
         logger.info(f"获取股票列表成功，共{len(df)}条")
         return df
 
     @retry_on_error(max_retries=3)
-    @rate_limit(calls_per_minute=200)
+    @rate_limit
     def get_trade_calendar(self, start_date: str, end_date: str, exchange: str = 'SSE') -> pd.DataFrame:
         """
         获取交易日历
@@ -109,15 +256,16 @@ class TushareClient:
         Returns:
             DataFrame包含: exchange, cal_date, is_open等
         """
-        df = self.pro.trade_cal(exchange=exchange, start_date=start_date, end_date=end_date)
+        df = self._query('trade_cal', exchange=exchange, start_date=start_date, end_date=end_date)
         return df
 
     # ==================== 行情数据 ====================
 
     @retry_on_error(max_retries=3)
-    @rate_limit(calls_per_minute=200)
+    @rate_limit
     def get_daily_quotes(self, ts_code: str = None, trade_date: str = None,
-                         start_date: str = None, end_date: str = None) -> pd.DataFrame:
+                         start_date: str = None, end_date: str = None,
+                         optimize_dtypes: bool = False) -> pd.DataFrame:
         """
         获取日线行情数据
 
@@ -126,6 +274,7 @@ class TushareClient:
             trade_date: 交易日期 YYYYMMDD
             start_date: 开始日期 YYYYMMDD
             end_date: 结束日期 YYYYMMDD
+            optimize_dtypes: 是否压缩列类型（见 optimize_quote_dtypes）
 
         Returns:
             DataFrame包含: ts_code, trade_date, open, high, low, close, vol, amount等
@@ -140,16 +289,19 @@ class TushareClient:
         if end_date:
             params['end_date'] = end_date
 
-        df = self.pro.daily(**params)
+        df = self._query('daily', **params)
+        if optimize_dtypes and df is not None:
+            df = self.optimize_quote_dtypes(df)
 
         if df is not None and not df.empty:
             logger.info(f"获取日线行情成功，共{len(df)}条")
         return df
 
     @retry_on_error(max_retries=3)
-    @rate_limit(calls_per_minute=200)
+    @rate_limit
     def get_daily_basic(self, ts_code: str = None, trade_date: str = None,
-                        start_date: str = None, end_date: str = None) -> pd.DataFrame:
+                        start_date: str = None, end_date: str = None,
+                        optimize_dtypes: bool = False) -> pd.DataFrame:
         """
         获取每日指标数据
 
@@ -158,6 +310,7 @@ class TushareClient:
             trade_date: 交易日期 YYYYMMDD
             start_date: 开始日期 YYYYMMDD
             end_date: 结束日期 YYYYMMDD
+            optimize_dtypes: 是否压缩列类型（见 optimize_quote_dtypes）
 
         Returns:
             DataFrame包含: ts_code, trade_date, turnover_rate, pe, pb, total_mv, circ_mv等
@@ -172,7 +325,9 @@ class TushareClient:
         if end_date:
             params['end_date'] = end_date
 
-        df = self.pro.daily_basic(**params)
+        df = self._query('daily_basic', **params)
+        if optimize_dtypes and df is not None:
+            df = self.optimize_quote_dtypes(df)
 
         if df is not None and not df.empty:
             logger.info(f"获取每日指标成功，共{len(df)}条")
@@ -181,20 +336,21 @@ class TushareClient:
     # ==================== 财务数据 ====================
 
     @retry_on_error(max_retries=3)
-    @rate_limit(calls_per_minute=200)
-    def get_income_statement(self, ts_code: str, period: str = None,
-                             start_date: str = None, end_date: str = None) -> pd.DataFrame:
+    @rate_limit
+    def _fetch_periodic(self, endpoint: str, ts_code: str, period: str = None,
+                        start_date: str = None, end_date: str = None) -> pd.DataFrame:
         """
-        获取利润表数据
+        获取按报告期发布的财务报表数据
 
         Args:
+            endpoint: 接口名称，见 PERIODIC_ENDPOINTS
             ts_code: 股票代码
             period: 报告期 YYYYMMDD
             start_date: 开始日期
             end_date: 结束日期
 
         Returns:
-            DataFrame包含: total_revenue, revenue_yoy, n_income等
+            报表DataFrame
         """
         params = {'ts_code': ts_code}
         if period:
@@ -204,14 +360,28 @@ class TushareClient:
         if end_date:
             params['end_date'] = end_date
 
-        df = self.pro.income(**params)
+        df = self._query(endpoint, **params)
 
         if df is not None and not df.empty:
-            logger.info(f"获取利润表数据成功: {ts_code}，共{len(df)}条")
+            logger.debug(f"获取{PERIODIC_ENDPOINTS[endpoint]}数据成功: {ts_code}，共{len(df)}条")
         return df
 
-    @retry_on_error(max_retries=3)
-    @rate_limit(calls_per_minute=200)
+    def get_income_statement(self, ts_code: str, period: str = None,
+                             start_date: str = None, end_date: str = None) -> pd.DataFrame:
+        """
+        获取利润表数据
+
+        Args:
+            ts_code: 股票代码
+            period: 报告期 YYYYMMDD
+            start_date: 开始日期
+            end_date: 结束日期
+
+        Returns:
+            DataFrame包含: total_revenue, revenue_yoy, n_income等
+        """
+        return self._fetch_periodic('income', ts_code, period, start_date, end_date)
+
     def get_balance_sheet(self, ts_code: str, period: str = None,
                           start_date: str = None, end_date: str = None) -> pd.DataFrame:
         """
@@ -226,22 +396,8 @@ class TushareClient:
         Returns:
             DataFrame包含: total_assets, total_liab, total_hldr_eqy_exc_min_int等
         """
-        params = {'ts_code': ts_code}
-        if period:
-            params['period'] = period
-        if start_date:
-            params['start_date'] = start_date
-        if end_date:
-            params['end_date'] = end_date
-
-        df = self.pro.balancesheet(**params)
+        return self._fetch_periodic('balancesheet', ts_code, period, start_date, end_date)
 
-        if df is not None and not df.empty:
-            logger.info(f"获取资产负债表数据成功: {ts_code}，共{len(df)}条")
-        return df
-
-    @retry_on_error(max_retries=3)
-    @rate_limit(calls_per_minute=200)
     def get_cash_flow(self, ts_code: str, period: str = None,
                       start_date: str = None, end_date: str = None) -> pd.DataFrame:
         """
@@ -256,24 +412,10 @@ class TushareClient:
         Returns:
             DataFrame包含: n_cashflow_act等
         """
-        params = {'ts_code': ts_code}
-        if period:
-            params['period'] = period
-        if start_date:
-            params['start_date'] = start_date
-        if end_date:
-            params['end_date'] = end_date
-
-        df = self.pro.cashflow(**params)
+        return self._fetch_periodic('cashflow', ts_code, period, start_date, end_date)
 
-        if df is not None and not df.empty:
-            logger.info(f"获取现金流量表数据成功: {ts_code}，共{len(df)}条")
-        return df
-
-    @retry_on_error(max_retries=3)
-    @rate_limit(calls_per_minute=200)
     def get_financial_indicator(self, ts_code: str, period: str = None,
-                                 start_date: str = None, end_date: str = None) -> pd.DataFrame:
+                                start_date: str = None, end_date: str = None) -> pd.DataFrame:
         """
         获取财务指标数据
 
@@ -286,24 +428,32 @@ class TushareClient:
         Returns:
             DataFrame包含: eps, roe, roa, debt_to_assets, current_ratio等
         """
-        params = {'ts_code': ts_code}
-        if period:
-            params['period'] = period
-        if start_date:
-            params['start_date'] = start_date
-        if end_date:
-            params['end_date'] = end_date
+        return self._fetch_periodic('fina_indicator', ts_code, period, start_date, end_date)
+
+    @retry_on_error(max_retries=3)
+    @rate_limit
+    def get_financial_indicator_by_period(self, period: str) -> pd.DataFrame:
+        """
+        获取全市场某一报告期的财务指标数据（批量接口，扫描全市场时优先使用）
+
+        一次请求返回所有股票，替代按股票逐个调用get_financial_indicator
 
-        df = self.pro.fina_indicator(**params)
+        Args:
+            period: 报告期 YYYYMMDD
+
+        Returns:
+            DataFrame包含: ts_code, end_date, eps, roe, roa, debt_to_assets, current_ratio等
+        """
+        df = self._query('fina_indicator_vip', period=period)
 
         if df is not None and not df.empty:
-            logger.info(f"获取财务指标数据成功: {ts_code}，共{len(df)}条")
+            logger.info(f"获取全市场财务指标数据成功: {period}，共{len(df)}条")
         return df
 
     # ==================== 行业数据 ====================
 
     @retry_on_error(max_retries=3)
-    @rate_limit(calls_per_minute=200)
+    @rate_limit
     def get_industry_index_list(self, src: str = 'SW2021') -> pd.DataFrame:
         """
         获取行业指数列表
@@ -314,15 +464,16 @@ class TushareClient:
         Returns:
             DataFrame包含: index_code, index_name, industry_name等
         """
-        df = self.pro.index_classify(level='L1', src=src)
+        df = self._query('index_classify', level='L1', src=src)
 
         if df is not None and not df.empty:
             logger.info(f"获取行业指数列表成功，共{len(df)}条")
         return df
 
     @retry_on_error(max_retries=3)
-    @rate_limit(calls_per_minute=200)
-    def get_industry_index_daily(self, ts_code: str, start_date: str, end_date: str = None) -> pd.DataFrame:
+    @rate_limit
+    def get_industry_index_daily(self, ts_code: str, start_date: str, end_date: str = None,
+                                 optimize_dtypes: bool = False) -> pd.DataFrame:
         """
         获取行业指数日线行情
 
@@ -330,6 +481,7 @@ class TushareClient:
             ts_code: 指数代码
             start_date: 开始日期 YYYYMMDD
             end_date: 结束日期 YYYYMMDD
+            optimize_dtypes: 是否压缩列类型（见 optimize_quote_dtypes）
 
         Returns:
             DataFrame包含: ts_code, trade_date, close, pct_chg, vol, amount等
@@ -341,14 +493,16 @@ class TushareClient:
         if end_date:
             params['end_date'] = end_date
 
-        df = self.pro.index_daily(**params)
+        df = self._query('index_daily', **params)
+        if optimize_dtypes and df is not None:
+            df = self.optimize_quote_dtypes(df)
 
         if df is not None and not df.empty:
-            logger.info(f"获取行业指数行情成功: {ts_code}，共{len(df)}条")
+            logger.debug(f"获取行业指数行情成功: {ts_code}，共{len(df)}条")
         return df
 
     @retry_on_error(max_retries=3)
-    @rate_limit(calls_per_minute=200)
+    @rate_limit
     def get_stock_industry(self, ts_code: str = None, src: str = 'SW2021') -> pd.DataFrame:
         """
         获取股票所属行业
@@ -364,7 +518,7 @@ class TushareClient:
         if ts_code:
             params['ts_code'] = ts_code
 
-        df = self.pro.index_member(**params)
+        df = self._query('index_member', **params)
 
         if df is not None and not df.empty:
             logger.info(f"获取股票行业分类成功，共{len(df)}条")
@@ -373,6 +527,7 @@ class TushareClient:
     # ==================== 工具方法 ====================
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def convert_to_ts_code(code: str, market: str) -> str:
         """
         转换为Tushare格式代码
@@ -387,6 +542,7 @@ class TushareClient:
         return f"{code}.{market.upper()}"
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def convert_from_ts_code(ts_code: str) -> tuple:
         """
         从Tushare格式转换为普通格式
@@ -402,6 +558,34 @@ class TushareClient:
             return code, market
         return ts_code, None
 
+    @staticmethod
+    def split_ts_codes(ts_codes: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """
+        批量拆分Tushare格式代码（convert_from_ts_code的向量化版本）
+
+        Args:
+            ts_codes: Tushare格式代码列 如 '600000.SH'
+
+        Returns:
+            (代码列, 市场列)，没有市场后缀时市场为None
+        """
+        parts = ts_codes.astype(str).str.partition('.')
+        return parts[0], parts[2].where(parts[2] != '', None)
+
+    @staticmethod
+    def join_ts_codes(codes: pd.Series, markets: pd.Series) -> pd.Series:
+        """
+        批量拼接为Tushare格式代码（convert_to_ts_code的向量化版本）
+
+        Args:
+            codes: 股票代码列 如 '600000'
+            markets: 市场列 'SZ' 或 'SH'
+
+        Returns:
+            Tushare格式代码列 如 '600000.SH'
+        """
+        return codes.astype(str).str.cat(markets.astype(str).str.upper(), sep='.')
+
     @staticmethod
     def date_to_tushare_format(date_str: str) -> str:
         """
@@ -429,3 +613,69 @@ class TushareClient:
         if len(ts_date) == 8:
             return f"{ts_date[:4]}-{ts_date[4:6]}-{ts_date[6:8]}"
         return ts_date
+
+    @staticmethod
+    def dates_to_tushare_format(dates: pd.Series) -> pd.Series:
+        """
+        批量转换日期为Tushare格式（date_to_tushare_format的向量化版本）
+
+        Args:
+            dates: 日期字符串列 '2025-01-04' 或 '20250104'
+
+        Returns:
+            Tushare格式日期列 '20250104'
+        """
+        return dates.astype(str).str.replace('-', '', regex=False)
+
+    @staticmethod
+    def tushare_dates_to_normal(ts_dates: pd.Series) -> pd.Series:
+        """
+        批量将Tushare日期转为普通格式（tushare_date_to_normal的向量化版本）
+
+        Args:
+            ts_dates: Tushare日期列 '20250104'
+
+        Returns:
+            普通格式日期列 '2025-01-04'，无法解析的值保持原样
+        """
+        ts_dates = ts_dates.astype(str)
+        parsed = pd.to_datetime(ts_dates, format='%Y%m%d', errors='coerce')
+        return parsed.dt.strftime('%Y-%m-%d').where(parsed.notna(), ts_dates)
+
+    @staticmethod
+    def optimize_quote_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        压缩行情数据的列类型，适合在内存中保存和分析大量日线数据
+
+        ts_code转为category，trade_date转为datetime64，价格与比率转为float32，
+        成交量、成交额、市值等大数值列保持float64
+
+        Args:
+            df: Tushare行情DataFrame
+
+        Returns:
+            转换后的DataFrame
+        """
+        dtypes = {
+            name: 'float32' for name, dtype in df.dtypes.items()
+            if dtype == 'float64' and name not in FLOAT64_QUOTE_COLUMNS
+        }
+        if 'ts_code' in df.columns:
+            dtypes['ts_code'] = 'category'
+        df = df.astype(dtypes)
+        if 'trade_date' in df.columns:
+            df['trade_date'] = pd.to_datetime(df['trade_date'], format='%Y%m%d', errors='coerce')
+        return df
+
+
+@lru_cache(maxsize=None)
+def get_default_client() -> TushareClient:
+    """
+    获取进程内共享的TushareClient实例（首次调用时创建）
+
+    共用同一个pro_api句柄、并发限制和令牌桶，避免多个客户端各自计算调用频率
+
+    Returns:
+        TushareClient实例
+    """
+    return TushareClient()
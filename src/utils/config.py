@@ -1,6 +1,7 @@
 """配置管理模块"""
 import os
 import yaml
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict
 from dotenv import load_dotenv
@@ -13,6 +14,7 @@ class Config:
         self.base_dir = Path(__file__).parent.parent.parent
         self.config_file = self.base_dir / "config" / "config.yaml"
         self._config: Dict[str, Any] = {}
+        self._flat: Dict[str, Any] = {}
         self._load_env()
         self._load_yaml()
 
@@ -26,10 +28,42 @@ class Config:
         """加载YAML配置文件"""
         if self.config_file.exists():
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                self._config = yaml.safe_load(f)
+                raw = yaml.safe_load(f)
         else:
             raise FileNotFoundError(f"配置文件不存在: {self.config_file}")
 
+        # 预先展开为点号分隔的完整键，get() 只需一次字典查找；
+        # 构建完成后再整体替换，重新加载期间的读取不会看到不完整的配置
+        raw = raw or {}
+        flat: Dict[str, Any] = {}
+        self._flatten(raw, '', flat)
+        self._config = raw
+        self._flat = flat
+
+    def _flatten(self, node: Dict[str, Any], prefix: str, flat: Dict[str, Any]):
+        """
+        将嵌套配置展开到 flat，每一级子树都以完整路径为键保存
+
+        Args:
+            node: 配置字典
+            prefix: 当前层级的键前缀
+            flat: 展开结果
+        """
+        for k, v in node.items():
+            if v is None:
+                continue
+            key = f"{prefix}{k}"
+            flat[key] = v
+            if isinstance(v, dict):
+                self._flatten(v, f"{key}.", flat)
+
+    def reload(self):
+        """重新读取配置文件，并清除已缓存的各配置段"""
+        self._load_yaml()
+        for name, attr in vars(type(self)).items():
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         获取配置值，支持点号分隔的嵌套键
@@ -41,64 +75,53 @@ class Config:
         Returns:
             配置值
         """
-        keys = key.split('.')
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-                if value is None:
-                    return default
-            else:
-                return default
-
-        return value
+        return self._flat.get(key, default)
 
     def get_env(self, key: str, default: str = None) -> str:
         """获取环境变量"""
         return os.getenv(key, default)
 
-    @property
+    @cached_property
     def app(self) -> Dict[str, Any]:
         """获取应用配置"""
         return self._config.get('app', {})
 
-    @property
+    @cached_property
     def database(self) -> Dict[str, Any]:
         """获取数据库配置"""
         return self._config.get('database', {})
 
-    @property
+    @cached_property
     def crawler(self) -> Dict[str, Any]:
         """获取爬虫配置"""
         return self._config.get('crawler', {})
 
-    @property
+    @cached_property
     def eastmoney(self) -> Dict[str, Any]:
         """获取东方财富网URL配置"""
         return self._config.get('eastmoney', {})
 
-    @property
+    @cached_property
     def graham(self) -> Dict[str, Any]:
         """获取格雷厄姆算法配置"""
         return self._config.get('graham', {})
 
-    @property
+    @cached_property
     def scheduler(self) -> Dict[str, Any]:
         """获取调度器配置"""
         return self._config.get('scheduler', {})
 
-    @property
+    @cached_property
     def trading_hours(self) -> Dict[str, Any]:
         """获取交易时间配置"""
         return self._config.get('trading_hours', {})
 
-    @property
+    @cached_property
     def api(self) -> Dict[str, Any]:
         """获取API配置"""
         return self._config.get('api', {})
 
-    @property
+    @cached_property
     def base_path(self) -> Path:
         """获取项目根目录"""
         return self.base_dir
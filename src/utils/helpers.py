@@ -1,10 +1,122 @@
 """辅助函数模块"""
 import random
 import time
-from datetime import datetime, time as dt_time
-from typing import List, Any, Dict
-import pytz
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time as dt_time
+from typing import Callable, List, Any, Dict
+import numpy as np
+import pandas as pd
+from zoneinfo import ZoneInfo
 from .config import config
+from .logger import logger
+
+
+def _parse_time(value: str) -> dt_time:
+    """解析 'HH:MM' 格式的时间"""
+    return datetime.strptime(value, '%H:%M').time()
+
+
+def refresh_trading_hours():
+    """从配置重新加载时区和交易时间（修改配置文件并调用 config.reload() 后调用）"""
+    global _TZ, _TRADING_HOURS, _TRADING_STATUS
+
+    trading_hours = config.trading_hours
+    _TZ = ZoneInfo(config.get('scheduler.timezone', 'Asia/Shanghai'))
+    _TRADING_HOURS = (
+        # 上午交易时间
+        _parse_time(trading_hours.get('morning_start', '09:30')),
+        _parse_time(trading_hours.get('morning_end', '11:30')),
+        # 下午交易时间
+        _parse_time(trading_hours.get('afternoon_start', '13:00')),
+        _parse_time(trading_hours.get('afternoon_end', '15:00')),
+    )
+    _TRADING_STATUS = (0.0, False, False)
+
+
+# 时区和交易时间在导入时解析一次，避免每次判断都重复解析配置
+refresh_trading_hours()
+
+# 交易状态的缓存有效期（秒），轮询时同一秒内直接复用结果
+TRADING_STATUS_TTL = 1.0
+
+# 交易日历获取失败后，按工作日判断并在该时间（秒）后再重试
+CALENDAR_RETRY_INTERVAL = 3600
+
+# 当年的开市日期集合 {年份: {'YYYYMMDD', ...}}，跨年时替换
+_OPEN_DAYS: Dict[int, frozenset] = {}
+_CALENDAR_RETRY_AT = 0.0
+
+
+def _is_open_day(day: date) -> bool:
+    """
+    判断某日是否开市，交易日历每年只获取一次
+
+    Args:
+        day: 日期
+
+    Returns:
+        是否开市
+    """
+    global _OPEN_DAYS, _CALENDAR_RETRY_AT
+
+    open_days = _OPEN_DAYS.get(day.year)
+    if open_days is None and time.monotonic() >= _CALENDAR_RETRY_AT:
+        try:
+            # 延迟导入：数据源模块依赖本模块
+            from src.data_source.data_fetcher import get_default_fetcher
+            open_days = get_default_fetcher().fetch_open_days(day.year)
+        except Exception as e:
+            logger.warning(f"获取交易日历失败，暂按工作日判断: {e}")
+            open_days = None
+
+        if open_days:
+            _OPEN_DAYS = {day.year: open_days}
+        else:
+            open_days = None
+            _CALENDAR_RETRY_AT = time.monotonic() + CALENDAR_RETRY_INTERVAL
+
+    if open_days is None:
+        # 0=周一, 6=周日
+        return day.weekday() < 5
+    return day.strftime('%Y%m%d') in open_days
+
+
+def _trading_status() -> tuple:
+    """
+    获取当前交易状态，1秒内复用上次计算结果
+
+    Returns:
+        (是否为交易日, 是否在交易时间)
+    """
+    global _TRADING_STATUS
+
+    expires, is_day, is_time = _TRADING_STATUS
+    if time.monotonic() < expires:
+        return is_day, is_time
+
+    now = datetime.now(_TZ)
+    is_day = _is_open_day(now.date())
+    morning_start, morning_end, afternoon_start, afternoon_end = _TRADING_HOURS
+    current = now.time()
+    is_time = is_day and (
+        (morning_start <= current <= morning_end) or
+        (afternoon_start <= current <= afternoon_end)
+    )
+    _TRADING_STATUS = (time.monotonic() + TRADING_STATUS_TTL, is_day, is_time)
+    return is_day, is_time
+
+
+def refresh_delay_range():
+    """从配置重新加载random_delay的默认延迟范围（修改配置文件并调用 config.reload() 后调用）"""
+    global _DELAY_RANGE
+
+    _DELAY_RANGE = (
+        float(config.get('crawler.delay.min', 1)),
+        float(config.get('crawler.delay.max', 3)),
+    )
+
+
+refresh_delay_range()
 
 
 def random_delay(min_seconds: float = None, max_seconds: float = None):
@@ -16,12 +128,11 @@ def random_delay(min_seconds: float = None, max_seconds: float = None):
         max_seconds: 最大延迟秒数
     """
     if min_seconds is None:
-        min_seconds = config.get('crawler.delay.min', 1)
+        min_seconds = _DELAY_RANGE[0]
     if max_seconds is None:
-        max_seconds = config.get('crawler.delay.max', 3)
+        max_seconds = _DELAY_RANGE[1]
 
-    delay = random.uniform(min_seconds, max_seconds)
-    time.sleep(delay)
+    time.sleep(min_seconds + (max_seconds - min_seconds) * random.random())
 
 
 def get_random_user_agent() -> str:
@@ -34,15 +145,12 @@ def get_random_user_agent() -> str:
 
 def is_trading_day() -> bool:
     """
-    判断当前是否为交易日（简化版，仅判断工作日）
+    判断当前是否为交易日（按交易所日历，含节假日；日历不可用时仅判断工作日）
 
     Returns:
         是否为交易日
     """
-    tz = pytz.timezone(config.get('scheduler.timezone', 'Asia/Shanghai'))
-    now = datetime.now(tz)
-    # 0=周一, 6=周日
-    return now.weekday() < 5
+    return _trading_status()[0]
 
 
 def is_trading_time() -> bool:
@@ -52,32 +160,7 @@ def is_trading_time() -> bool:
     Returns:
         是否在交易时间
     """
-    if not is_trading_day():
-        return False
-
-    tz = pytz.timezone(config.get('scheduler.timezone', 'Asia/Shanghai'))
-    now = datetime.now(tz).time()
-
-    trading_hours = config.trading_hours
-
-    # 上午交易时间
-    morning_start = datetime.strptime(
-        trading_hours.get('morning_start', '09:30'), '%H:%M'
-    ).time()
-    morning_end = datetime.strptime(
-        trading_hours.get('morning_end', '11:30'), '%H:%M'
-    ).time()
-
-    # 下午交易时间
-    afternoon_start = datetime.strptime(
-        trading_hours.get('afternoon_start', '13:00'), '%H:%M'
-    ).time()
-    afternoon_end = datetime.strptime(
-        trading_hours.get('afternoon_end', '15:00'), '%H:%M'
-    ).time()
-
-    return (morning_start <= now <= morning_end) or \
-           (afternoon_start <= now <= afternoon_end)
+    return _trading_status()[1]
 
 
 def safe_float(value: Any, default: float = 0.0) -> float:
@@ -125,6 +208,47 @@ def safe_int(value: Any, default: int = 0) -> int:
         return default
 
 
+def safe_float_series(series: pd.Series, default: float = 0.0) -> pd.Series:
+    """
+    安全转换整列为浮点数（safe_float的向量化版本）
+
+    Args:
+        series: 待转换的列
+        default: 转换失败时的默认值
+
+    Returns:
+        float64列
+    """
+    if series.dtype == object:
+        # 移除可能的百分号和逗号
+        series = series.astype(str).str.replace('%', '', regex=False) \
+            .str.replace(',', '', regex=False).str.strip()
+    return pd.to_numeric(series, errors='coerce').fillna(default).astype('float64')
+
+
+def safe_int_series(series: pd.Series, default: int = 0) -> pd.Series:
+    """
+    安全转换整列为整数（safe_int的向量化版本，小数部分直接截断）
+
+    Args:
+        series: 待转换的列
+        default: 转换失败时的默认值
+
+    Returns:
+        int64列
+    """
+    if series.dtype == object:
+        series = series.astype(str).str.replace(',', '', regex=False).str.strip()
+    values = pd.to_numeric(series, errors='coerce').astype('float64')
+    # 无穷大无法转为整数，与缺失值一样使用默认值
+    values = values.where(np.isfinite(values), default)
+    return np.trunc(values).astype('int64')
+
+
+# clean_text的字符替换表：去掉换行符，制表符替换为空格
+_CLEAN_TEXT_TABLE = str.maketrans({'\n': '', '\r': '', '\t': ' '})
+
+
 def clean_text(text: str) -> str:
     """
     清理文本
@@ -137,7 +261,7 @@ def clean_text(text: str) -> str:
     """
     if not text:
         return ''
-    return text.strip().replace('\n', '').replace('\r', '').replace('\t', ' ')
+    return text.strip().translate(_CLEAN_TEXT_TABLE)
 
 
 def format_market_cap(value: float) -> str:
@@ -200,6 +324,32 @@ def chunks(lst: List[Any], n: int):
         yield lst[i:i + n]
 
 
+def chunks_parallel(lst: List[Any], n: int, func: Callable[[List[Any]], Any], max_workers: int = 8):
+    """
+    将列表分块后并发处理（适用于网络请求等I/O密集的批量任务）
+
+    Args:
+        lst: 原始列表
+        n: 每块大小
+        func: 处理单个分块的函数
+        max_workers: 最大并发线程数
+
+    Yields:
+        各分块的处理结果（与分块顺序一致）
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(func, chunks(lst, n))
+
+
+# 股票代码首位 -> 市场
+_MARKET_BY_PREFIX = {
+    '0': 'SZ',  # 深圳
+    '2': 'SZ',
+    '3': 'SZ',
+    '6': 'SH',  # 上海
+}
+
+
 def get_stock_market(code: str) -> str:
     """
     根据股票代码判断所属市场
@@ -210,12 +360,20 @@ def get_stock_market(code: str) -> str:
     Returns:
         市场代码 ('SZ' or 'SH')
     """
-    if code.startswith(('0', '2', '3')):
-        return 'SZ'  # 深圳
-    elif code.startswith('6'):
-        return 'SH'  # 上海
-    else:
-        return 'UNKNOWN'
+    return _MARKET_BY_PREFIX.get(code[:1], 'UNKNOWN')
+
+
+def get_stock_markets(codes: pd.Series) -> pd.Series:
+    """
+    批量判断股票所属市场（get_stock_market的向量化版本）
+
+    Args:
+        codes: 股票代码列
+
+    Returns:
+        市场代码列 ('SZ', 'SH' 或 'UNKNOWN')
+    """
+    return codes.astype(str).str[:1].map(_MARKET_BY_PREFIX).fillna('UNKNOWN')
 
 
 def build_stock_url(code: str) -> str:
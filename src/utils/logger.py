@@ -36,7 +36,7 @@ class Logger:
             colorize=True
         )
 
-        # 添加文件输出
+        # 添加文件输出（enqueue=True：由后台线程写入和压缩，调用线程只需入队）
         log_path = config.get_log_path()
         self._logger.add(
             log_path / "app_{time:YYYY-MM-DD}.log",
@@ -45,7 +45,8 @@ class Logger:
             rotation=log_config.get('rotation', '500 MB'),
             retention=log_config.get('retention', '30 days'),
             compression=log_config.get('compression', 'zip'),
-            encoding='utf-8'
+            encoding='utf-8',
+            enqueue=True
         )
 
         # 添加错误日志文件
@@ -56,7 +57,8 @@ class Logger:
             rotation=log_config.get('rotation', '500 MB'),
             retention=log_config.get('retention', '30 days'),
             compression=log_config.get('compression', 'zip'),
-            encoding='utf-8'
+            encoding='utf-8',
+            enqueue=True
         )
 
     def debug(self, message: str, **kwargs):
@@ -1,16 +1,44 @@
 """IP代理池管理模块"""
+import asyncio
+import heapq
 import random
+import time
+from itertools import accumulate
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import threading
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.utils.logger import logger
 from src.utils.config import config
+from src.utils.thread_pool import ThreadPool
+
+try:
+    import aiohttp
+except ImportError:  # 未安装aiohttp时退回线程池并发测试
+    aiohttp = None
+
+
+# 批量测试代理的最大并发数（同时也是测试会话连接池的大小）
+TEST_MAX_WORKERS = 64
+
+# 不支持HEAD请求时服务器返回的状态码，此时改用GET探测（重定向时同样改用GET并跟随重定向）
+HEAD_REJECTED_STATUSES = (405, 501)
+
+# 异步批量测试时同时进行的最大探测数（单线程即可承载大量等待中的连接）
+ASYNC_TEST_CONCURRENCY = 500
+
+# 代理失败过多后暂停选择的时长（秒），到期后自动恢复
+FAILED_PROXY_TTL = 300
+
+# 代理选择快照：(可用代理, 累计选择权重, 成功率最高的代理, 过期时间)
+_Snapshot = Tuple[Tuple[Dict, ...], List[int], Dict, float]
+
+
+def _success_ratio(proxy: Dict) -> float:
+    """代理的成功率评分（成功次数 / (失败次数 + 1)）"""
+    return proxy['success_count'] / (proxy['fail_count'] + 1)
 
 
 class ProxyPool:
@@ -18,11 +46,40 @@ class ProxyPool:
 
     def __init__(self):
         self.logger = logger
-        self.proxies: List[Dict] = []
-        self.failed_proxies: set = set()
+        self.proxies: Dict[str, Dict] = {}  # 代理地址 -> 代理信息
         self.lock = threading.Lock()
         self.last_update = None
         self.update_interval = timedelta(hours=1)  # 每小时更新一次代理列表
+        self.session = self._create_session()
+        # 选择快照：(可用代理, 累计选择权重, 成功率最高的代理, 过期时间)，
+        # 代理增删或成功/失败计数变化时失效，有代理的失败期结束时过期
+        self._snapshot: Optional[_Snapshot] = None
+
+    @property
+    def failed_proxies(self) -> set:
+        """仍处于失败期的代理地址集合"""
+        now = time.monotonic()
+        with self.lock:
+            return {p['proxy'] for p in self.proxies.values() if p['failed_until'] > now}
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        创建代理测试使用的会话（复用连接，避免每次测试都重新握手）
+
+        连接池与并发测试线程数一致，并在连接用尽时阻塞等待，
+        避免并发探测时连接池已满而反复丢弃、新建连接
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=TEST_MAX_WORKERS,
+            pool_maxsize=TEST_MAX_WORKERS,
+            pool_block=True,
+            max_retries=0
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     def add_proxy(self, proxy: str, proxy_type: str = 'http'):
         """
@@ -32,20 +89,8 @@ class ProxyPool:
             proxy: 代理地址（格式：ip:port 或 user:pass@ip:port）
             proxy_type: 代理类型（http/https/socks5）
         """
-        proxy_dict = {
-            'proxy': proxy,
-            'type': proxy_type,
-            'fail_count': 0,
-            'success_count': 0,
-            'last_used': None,
-            'avg_response_time': 0
-        }
-
-        with self.lock:
-            # 检查是否已存在
-            if not any(p['proxy'] == proxy for p in self.proxies):
-                self.proxies.append(proxy_dict)
-                self.logger.info(f"添加代理: {proxy}")
+        if self._add_many([proxy], proxy_type):
+            self.logger.info(f"添加代理: {proxy}")
 
     def add_proxies_from_list(self, proxy_list: List[str], proxy_type: str = 'http'):
         """
@@ -55,8 +100,8 @@ class ProxyPool:
             proxy_list: 代理地址列表
             proxy_type: 代理类型
         """
-        for proxy in proxy_list:
-            self.add_proxy(proxy, proxy_type)
+        added = self._add_many(proxy_list, proxy_type)
+        self.logger.info(f"批量添加代理: 新增{added}个，共{len(proxy_list)}个")
 
     def add_proxies_from_file(self, filepath: str, proxy_type: str = 'http'):
         """
@@ -68,15 +113,51 @@ class ProxyPool:
         """
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                for line in f:
-                    proxy = line.strip()
-                    if proxy and not proxy.startswith('#'):
-                        self.add_proxy(proxy, proxy_type)
+                proxy_list = [
+                    proxy for proxy in (line.strip() for line in f)
+                    if proxy and not proxy.startswith('#')
+                ]
 
-            self.logger.info(f"从文件 {filepath} 加载了代理列表")
+            added = self._add_many(proxy_list, proxy_type)
+            self.logger.info(f"从文件 {filepath} 加载了代理列表，新增{added}个")
         except Exception as e:
             self.logger.error(f"读取代理文件失败: {e}")
 
+    def _add_many(self, proxy_list: List[str], proxy_type: str) -> int:
+        """
+        在一次加锁内添加多个代理，已存在的代理跳过
+
+        Args:
+            proxy_list: 代理地址列表
+            proxy_type: 代理类型
+
+        Returns:
+            新增的代理数量
+        """
+        with self.lock:
+            added = 0
+            for proxy in proxy_list:
+                if proxy in self.proxies:
+                    continue
+                # 代理URL及requests使用的代理字典只在添加时构建一次
+                url = f"{proxy_type}://{proxy}"
+                self.proxies[proxy] = {
+                    'proxy': proxy,
+                    'type': proxy_type,
+                    'url': url,
+                    'requests_dict': {'http': url, 'https': url},
+                    'fail_count': 0,
+                    'success_count': 0,
+                    'failed_until': 0.0,  # 失败过多时暂不参与选择，直到该时刻（monotonic）
+                    'last_used': None,
+                    'avg_response_time': 0
+                }
+                added += 1
+
+            if added:
+                self._invalidate()
+            return added
+
     def get_proxy(self, random_select: bool = True) -> Optional[Dict]:
         """
         获取一个可用代理
@@ -87,36 +168,55 @@ class ProxyPool:
         Returns:
             代理字典或None
         """
-        with self.lock:
-            if not self.proxies:
-                return None
-
-            # 过滤掉失败次数过多的代理
-            available_proxies = [
-                p for p in self.proxies
-                if p['proxy'] not in self.failed_proxies
-                and p['fail_count'] < 5
-            ]
-
-            if not available_proxies:
-                # 清空失败记录，重新开始
-                self.failed_proxies.clear()
-                for p in self.proxies:
-                    p['fail_count'] = 0
-                available_proxies = self.proxies
-
-            if random_select:
-                proxy = random.choice(available_proxies)
-            else:
-                # 按成功率排序
-                available_proxies.sort(
-                    key=lambda x: x['success_count'] / (x['fail_count'] + 1),
-                    reverse=True
-                )
-                proxy = available_proxies[0]
+        # 快照构建后不再修改，读取时无需加锁；只有快照失效或过期后的首次读取需要加锁重建
+        snapshot = self._snapshot
+        if snapshot is None or time.monotonic() >= snapshot[3]:
+            with self.lock:
+                if not self.proxies:
+                    return None
+                snapshot = self._build_snapshot()
+
+        available_proxies, cum_weights, best, _ = snapshot
+        if random_select:
+            # 按成功次数加权随机选择，成功率高的代理更容易被选中
+            proxy = random.choices(available_proxies, cum_weights=cum_weights)[0]
+        else:
+            proxy = best
+
+        proxy['last_used'] = datetime.now()
+        return proxy
+
+    def _build_snapshot(self) -> _Snapshot:
+        """
+        构建代理选择快照（调用方需持有锁，代理池不能为空）
 
-            proxy['last_used'] = datetime.now()
-            return proxy
+        Returns:
+            (可用代理, 累计选择权重, 成功率最高的代理, 快照过期时间)，
+            全部代理都处于失败期时暂时使用全部代理（保留各代理的成功/失败计数）
+        """
+        now = time.monotonic()
+        if self._snapshot is not None and now < self._snapshot[3]:
+            return self._snapshot
+
+        # 过滤掉仍处于失败期的代理，失败期已过的代理自动恢复参与选择
+        available_proxies = tuple(p for p in self.proxies.values() if p['failed_until'] <= now)
+        # 最早恢复的代理到期时快照随之过期
+        expires_at = min(
+            (p['failed_until'] for p in self.proxies.values() if p['failed_until'] > now),
+            default=float('inf')
+        )
+
+        if not available_proxies:
+            available_proxies = tuple(self.proxies.values())
+
+        cum_weights = list(accumulate(p['success_count'] + 1 for p in available_proxies))
+        best = max(available_proxies, key=_success_ratio)
+        self._snapshot = (available_proxies, cum_weights, best, expires_at)
+        return self._snapshot
+
+    def _invalidate(self):
+        """代理状态变化后清除选择快照（调用方需持有锁）"""
+        self._snapshot = None
 
     def get_proxy_dict(self, random_select: bool = True) -> Optional[Dict[str, str]]:
         """
@@ -127,17 +227,13 @@ class ProxyPool:
 
         Returns:
             代理字典，格式：{'http': 'http://ip:port', 'https': 'http://ip:port'}
+            （添加代理时预先构建的共享字典，调用方不应修改）
         """
         proxy_info = self.get_proxy(random_select)
         if not proxy_info:
             return None
 
-        proxy_url = f"{proxy_info['type']}://{proxy_info['proxy']}"
-
-        return {
-            'http': proxy_url,
-            'https': proxy_url
-        }
+        return proxy_info['requests_dict']
 
     def mark_success(self, proxy: str, response_time: float = 0):
         """
@@ -148,23 +244,23 @@ class ProxyPool:
             response_time: 响应时间（秒）
         """
         with self.lock:
-            for p in self.proxies:
-                if p['proxy'] == proxy:
-                    p['success_count'] += 1
+            p = self.proxies.get(proxy)
+            if p is None:
+                return
 
-                    # 更新平均响应时间
-                    if p['avg_response_time'] == 0:
-                        p['avg_response_time'] = response_time
-                    else:
-                        p['avg_response_time'] = (
-                            p['avg_response_time'] * 0.7 + response_time * 0.3
-                        )
+            p['success_count'] += 1
+            self._invalidate()
 
-                    # 从失败列表中移除
-                    if proxy in self.failed_proxies:
-                        self.failed_proxies.remove(proxy)
+            # 更新平均响应时间
+            if p['avg_response_time'] == 0:
+                p['avg_response_time'] = response_time
+            else:
+                p['avg_response_time'] = (
+                    p['avg_response_time'] * 0.7 + response_time * 0.3
+                )
 
-                    break
+            # 清除失败期
+            p['failed_until'] = 0.0
 
     def mark_failure(self, proxy: str):
         """
@@ -174,15 +270,16 @@ class ProxyPool:
             proxy: 代理地址
         """
         with self.lock:
-            for p in self.proxies:
-                if p['proxy'] == proxy:
-                    p['fail_count'] += 1
+            p = self.proxies.get(proxy)
+            if p is None:
+                return
 
-                    # 如果失败次数过多，加入失败列表
-                    if p['fail_count'] >= 3:
-                        self.failed_proxies.add(proxy)
+            p['fail_count'] += 1
+            self._invalidate()
 
-                    break
+            # 如果失败次数过多，在一段时间内不再选择该代理
+            if p['fail_count'] >= 3:
+                p['failed_until'] = time.monotonic() + FAILED_PROXY_TTL
 
     def remove_proxy(self, proxy: str):
         """
@@ -192,9 +289,8 @@ class ProxyPool:
             proxy: 代理地址
         """
         with self.lock:
-            self.proxies = [p for p in self.proxies if p['proxy'] != proxy]
-            if proxy in self.failed_proxies:
-                self.failed_proxies.remove(proxy)
+            self.proxies.pop(proxy, None)
+            self._invalidate()
 
             self.logger.info(f"移除代理: {proxy}")
 
@@ -211,20 +307,36 @@ class ProxyPool:
         Returns:
             是否可用
         """
-        proxy_dict = {
-            'http': f'http://{proxy}',
-            'https': f'http://{proxy}'
-        }
+        p = self.proxies.get(proxy)
+        if p is not None:
+            proxy_dict = p['requests_dict']
+        else:
+            proxy_dict = {
+                'http': f'http://{proxy}',
+                'https': f'http://{proxy}'
+            }
 
+        start = time.monotonic()
         try:
-            response = requests.get(
+            # 只需状态码：HEAD请求不下载响应体，服务器不支持HEAD或返回重定向时
+            # 改用流式GET（跟随重定向）并立即关闭，以最终响应是否为200判断代理可用
+            response = self.session.head(
                 test_url,
                 proxies=proxy_dict,
-                timeout=timeout
+                timeout=timeout,
+                allow_redirects=False
             )
+            if response.status_code in HEAD_REJECTED_STATUSES or 300 <= response.status_code < 400:
+                response = self.session.get(
+                    test_url,
+                    proxies=proxy_dict,
+                    timeout=timeout,
+                    stream=True
+                )
+                response.close()
 
             if response.status_code == 200:
-                self.mark_success(proxy, response.elapsed.total_seconds())
+                self.mark_success(proxy, time.monotonic() - start)
                 return True
             else:
                 self.mark_failure(proxy)
@@ -242,14 +354,98 @@ class ProxyPool:
         Args:
             test_url: 测试URL
         """
-        self.logger.info(f"开始测试 {len(self.proxies)} 个代理")
+        with self.lock:
+            proxies = [(p['proxy'], p['url'], p['type']) for p in self.proxies.values()]
+
+        self.logger.info(f"开始测试 {len(proxies)} 个代理")
+        if not proxies:
+            return
+
+        # 测试以网络等待为主，并发进行：优先用aiohttp在单线程内处理全部连接，
+        # aiohttp只支持http代理，其他类型的代理仍用线程池测试
+        if aiohttp is not None:
+            async_proxies = [(proxy, url) for proxy, url, proxy_type in proxies if proxy_type == 'http']
+            thread_proxies = [proxy for proxy, _, proxy_type in proxies if proxy_type != 'http']
+        else:
+            async_proxies = []
+            thread_proxies = [proxy for proxy, _, _ in proxies]
+
+        results = []
+        if async_proxies:
+            results += asyncio.run(self._test_all_async(async_proxies, test_url))
+        if thread_proxies:
+            pool = ThreadPool(max_workers=min(TEST_MAX_WORKERS, len(thread_proxies)))
+            try:
+                results += pool.map(lambda proxy: self.test_proxy(proxy, test_url), thread_proxies)
+            finally:
+                pool.shutdown()
+
+        self.logger.info(f"代理测试完成，可用: {sum(results)}/{len(proxies)}")
+
+    async def _test_all_async(self, proxies: List[Tuple[str, str]], test_url: str) -> List[bool]:
+        """
+        使用同一个aiohttp会话并发测试多个代理
 
-        working_count = 0
-        for proxy_info in self.proxies:
-            if self.test_proxy(proxy_info['proxy'], test_url):
-                working_count += 1
+        Args:
+            proxies: (代理地址, 代理URL) 列表
+            test_url: 测试URL
 
-        self.logger.info(f"代理测试完成，可用: {working_count}/{len(self.proxies)}")
+        Returns:
+            各代理是否可用
+        """
+        semaphore = asyncio.Semaphore(ASYNC_TEST_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=ASYNC_TEST_CONCURRENCY, limit_per_host=0)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def probe(proxy: str, url: str) -> bool:
+                async with semaphore:
+                    return await self._test_proxy_async(session, proxy, url, test_url)
+
+            return await asyncio.gather(*(probe(proxy, url) for proxy, url in proxies))
+
+    async def _test_proxy_async(self, session, proxy: str, proxy_url: str, test_url: str,
+                                timeout: int = 5) -> bool:
+        """
+        异步测试代理是否可用
+
+        Args:
+            session: aiohttp会话
+            proxy: 代理地址
+            proxy_url: 代理URL（含代理类型）
+            test_url: 测试URL
+            timeout: 超时时间
+
+        Returns:
+            是否可用
+        """
+        start = time.monotonic()
+        try:
+            request_timeout = aiohttp.ClientTimeout(total=timeout)
+            async with session.head(
+                test_url,
+                proxy=proxy_url,
+                timeout=request_timeout,
+                allow_redirects=False
+            ) as response:
+                status = response.status
+            # 与 test_proxy 相同：不支持HEAD或返回重定向时改用GET（跟随重定向）
+            if status in HEAD_REJECTED_STATUSES or 300 <= status < 400:
+                async with session.get(
+                    test_url,
+                    proxy=proxy_url,
+                    timeout=request_timeout
+                ) as response:
+                    status = response.status
+
+            if status == 200:
+                self.mark_success(proxy, time.monotonic() - start)
+                return True
+            self.mark_failure(proxy)
+            return False
+
+        except Exception as e:
+            self.logger.debug(f"代理 {proxy} 测试失败: {e}")
+            self.mark_failure(proxy)
+            return False
 
     def get_stats(self) -> Dict:
         """
@@ -260,7 +456,8 @@ class ProxyPool:
         """
         with self.lock:
             total = len(self.proxies)
-            failed = len(self.failed_proxies)
+            now = time.monotonic()
+            failed = sum(p['failed_until'] > now for p in self.proxies.values())
             available = total - failed
 
             return {
@@ -274,11 +471,8 @@ class ProxyPool:
                         'fail': p['fail_count'],
                         'avg_time': round(p['avg_response_time'], 2)
                     }
-                    for p in sorted(
-                        self.proxies,
-                        key=lambda x: x['success_count'] / (x['fail_count'] + 1),
-                        reverse=True
-                    )[:10]  # 只返回前10个最好的
+                    # 只返回前10个最好的，无需对全部代理排序
+                    for p in heapq.nlargest(10, self.proxies.values(), key=_success_ratio)
                 ]
             }
 
@@ -286,7 +480,10 @@ class ProxyPool:
         """清空代理池"""
         with self.lock:
             self.proxies.clear()
-            self.failed_proxies.clear()
+            self._invalidate()
+            # 关闭已建立的连接，后续测试使用新的会话
+            self.session.close()
+            self.session = self._create_session()
             self.logger.info("代理池已清空")
 
 
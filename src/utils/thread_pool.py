@@ -1,28 +1,47 @@
 """线程池管理模块"""
 import queue
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
 from typing import Callable, List, Any, Dict
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.utils.logger import logger
 
 
+def _call_safely(func: Callable, task: Any) -> Any:
+    """
+    执行单个任务，异常时记录日志并返回None（避免executor.map在首个异常处中断）
+
+    Args:
+        func: 要执行的函数
+        task: 任务参数
+
+    Returns:
+        任务结果，失败时为None
+    """
+    try:
+        return func(task)
+    except Exception as e:
+        logger.error(f"任务执行失败: {e}")
+        return None
+
+
 class ThreadPool:
     """线程池管理器"""
 
-    def __init__(self, max_workers: int = 5):
+    def __init__(self, max_workers: int = 5, use_processes: bool = False):
         """
         初始化线程池
 
         Args:
             max_workers: 最大工作线程数
+            use_processes: 是否改用进程池（适合解析、计算等CPU密集任务，
+                提交的函数及其参数、结果都必须可pickle；网络请求等I/O任务仍使用线程）
         """
         self.max_workers = max_workers
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self.executor = executor_class(max_workers=max_workers)
         self.logger = logger
 
     def submit_task(self, func: Callable, *args, **kwargs):
@@ -52,6 +71,30 @@ class ThreadPool:
         """
         self.logger.info(f"提交 {len(tasks)} 个任务到线程池")
 
+        if any(isinstance(task, (list, tuple, dict)) for task in tasks):
+            results = self._submit_each(func, tasks)
+        else:
+            # 单参数任务（常见情况）交给executor.map批量派发，省去逐个Future的同步开销
+            chunksize = max(1, len(tasks) // (4 * self.max_workers))
+            results = []
+            for result in self.executor.map(partial(_call_safely, func), tasks, chunksize=chunksize):
+                results.append(result)
+                self._log_progress(len(results), len(tasks))
+
+        self.logger.info(f"所有任务完成，成功: {len([r for r in results if r is not None])}/{len(tasks)}")
+        return results
+
+    def _submit_each(self, func: Callable, tasks: List[Any]) -> List[Any]:
+        """
+        逐个提交参数形式不同的任务（元组按位置参数、字典按关键字参数展开）
+
+        Args:
+            func: 要执行的函数
+            tasks: 任务参数列表
+
+        Returns:
+            按完成顺序排列的结果列表，失败的任务结果为None
+        """
         futures = []
         for task in tasks:
             if isinstance(task, (list, tuple)):
@@ -64,24 +107,22 @@ class ThreadPool:
 
         # 等待所有任务完成并收集结果
         results = []
-        completed = 0
 
         for future in as_completed(futures):
             try:
-                result = future.result()
-                results.append(result)
-                completed += 1
-
-                if completed % 10 == 0 or completed == len(futures):
-                    self.logger.info(f"任务进度: {completed}/{len(futures)}")
-
+                results.append(future.result())
             except Exception as e:
                 self.logger.error(f"任务执行失败: {e}")
                 results.append(None)
+            self._log_progress(len(results), len(futures))
 
-        self.logger.info(f"所有任务完成，成功: {len([r for r in results if r is not None])}/{len(tasks)}")
         return results
 
+    def _log_progress(self, completed: int, total: int):
+        """每完成10个任务及全部完成时记录进度"""
+        if completed % 10 == 0 or completed == total:
+            self.logger.info(f"任务进度: {completed}/{total}")
+
     def map(self, func: Callable, items: List[Any], timeout: int = None) -> List[Any]:
         """
         对列表中的每个元素执行函数（类似map）
@@ -120,7 +161,6 @@ class TaskQueue:
         self.queue = queue.Queue(maxsize=max_size)
         self.logger = logger
         self.workers = []
-        self.running = False
 
     def add_task(self, func: Callable, *args, **kwargs):
         """
@@ -135,25 +175,20 @@ class TaskQueue:
         self.queue.put(task)
 
     def worker(self):
-        """工作线程"""
-        while self.running:
+        """工作线程（阻塞等待任务，收到None时退出）"""
+        while True:
+            task = self.queue.get()
+            if task is None:
+                self.queue.task_done()
+                break
+
+            func, args, kwargs = task
             try:
-                task = self.queue.get(timeout=1)
-                if task is None:
-                    break
-
-                func, args, kwargs = task
-                try:
-                    func(*args, **kwargs)
-                except Exception as e:
-                    self.logger.error(f"任务执行失败: {e}")
-                finally:
-                    self.queue.task_done()
-
-            except queue.Empty:
-                continue
+                func(*args, **kwargs)
             except Exception as e:
-                self.logger.error(f"工作线程异常: {e}")
+                self.logger.error(f"任务执行失败: {e}")
+            finally:
+                self.queue.task_done()
 
     def start(self, num_workers: int = 5):
         """
@@ -162,8 +197,6 @@ class TaskQueue:
         Args:
             num_workers: 工作线程数量
         """
-        self.running = True
-
         for i in range(num_workers):
             worker_thread = threading.Thread(target=self.worker, name=f"Worker-{i}")
             worker_thread.daemon = True
@@ -178,10 +211,8 @@ class TaskQueue:
         self.logger.info("所有任务已完成")
 
     def stop(self):
-        """停止所有工作线程"""
-        self.running = False
-
-        # 添加None作为停止信号
+        """停止所有工作线程（已加入队列的任务执行完后才会停止）"""
+        # 每个工作线程一个None作为停止信号
         for _ in self.workers:
             self.queue.put(None)
 
@@ -207,25 +238,23 @@ class RateLimiter:
         self.rate = rate
         self.per = per
         self.allowance = rate
-        self.last_check = threading.current_thread().ident
+        self._last_time = time.monotonic()
         self.lock = threading.Lock()
 
     def acquire(self):
         """获取令牌（阻塞直到可以执行）"""
-        import time
-
         with self.lock:
-            current = time.time()
-            time_passed = current - getattr(self, '_last_time', current)
+            current = time.monotonic()
+            time_passed = current - self._last_time
             self._last_time = current
 
             self.allowance += time_passed * (self.rate / self.per)
             if self.allowance > self.rate:
                 self.allowance = self.rate
 
-            if self.allowance < 1.0:
-                sleep_time = (1.0 - self.allowance) * (self.per / self.rate)
-                time.sleep(sleep_time)
-                self.allowance = 0.0
-            else:
-                self.allowance -= 1.0
+            # 先扣除令牌（可透支），不足部分换算为等待时间；在锁外等待，其他线程可同时排队
+            self.allowance -= 1.0
+            sleep_time = -self.allowance * (self.per / self.rate) if self.allowance < 0 else 0
+
+        if sleep_time > 0:
+            time.sleep(sleep_time)
@@ -1,9 +1,6 @@
 #!/usr/bin/env python
 """测试新架构 - 不使用数据库"""
 import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent))
 
 from src.data_source.data_fetcher import DataFetcher
 from src.utils.logger import logger
@@ -0,0 +1,127 @@
+"""TTL缓存测试：并发未命中只计算一次、异常与空结果不缓存、清空时丢弃计算中的结果"""
+import threading
+import time
+
+from src.data_source.cache import ttl_cache
+
+THREADS = 8
+
+
+def _run_concurrently(func, *args):
+    """多个线程在同一时刻调用func，返回各线程的结果或异常"""
+    barrier = threading.Barrier(THREADS)
+    results = [None] * THREADS
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = func(*args)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_concurrent_miss_computes_once():
+    """同一键并发未命中时只调用一次，其余线程得到同一个结果"""
+    calls = []
+
+    @ttl_cache(ttl=0.2)
+    def load(key):
+        calls.append(key)
+        time.sleep(0.1)
+        return [key]
+
+    results = _run_concurrently(load, 'a')
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+    # 过期后再次并发调用，仍只重新计算一次
+    time.sleep(0.25)
+    _run_concurrently(load, 'a')
+    assert len(calls) == 2
+
+
+def test_waiters_receive_owner_exception():
+    """计算失败时所有等待者收到同一个异常，且异常不缓存"""
+    calls = []
+
+    @ttl_cache(ttl=60)
+    def load():
+        calls.append(1)
+        time.sleep(0.1)
+        raise ValueError('boom')
+
+    results = _run_concurrently(load)
+    assert len(calls) == 1
+    assert all(isinstance(r, ValueError) and str(r) == 'boom' for r in results)
+
+    _run_concurrently(load)
+    assert len(calls) == 2
+
+
+def test_falsy_result_not_cached():
+    """空结果不缓存，下次调用重新计算"""
+    calls = []
+
+    @ttl_cache(ttl=60)
+    def load():
+        calls.append(1)
+        return []
+
+    assert load() == []
+    assert load() == []
+    assert len(calls) == 2
+
+
+def test_equivalent_calls_share_entry():
+    """省略默认参数、按位置或按关键字传参使用同一个缓存键"""
+    calls = []
+
+    @ttl_cache(ttl=60)
+    def load(market=None):
+        calls.append(market)
+        return [market]
+
+    load()
+    load(None)
+    load(market=None)
+    assert len(calls) == 1
+
+
+def test_clear_drops_in_flight_result():
+    """计算期间清空缓存时，计算结果不写回缓存"""
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @ttl_cache(ttl=60)
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return [len(calls)]
+
+    t = threading.Thread(target=load)
+    t.start()
+    started.wait()
+    load.cache_clear()
+    release.set()
+    t.join()
+
+    assert load() == [2]
+    assert len(calls) == 2
+
+
+if __name__ == '__main__':
+    test_concurrent_miss_computes_once()
+    test_waiters_receive_owner_exception()
+    test_falsy_result_not_cached()
+    test_equivalent_calls_share_entry()
+    test_clear_drops_in_flight_result()
+    print('ok')
@@ -0,0 +1,71 @@
+"""格雷厄姆分析测试：批量分析与逐只分析结果一致"""
+import math
+import random
+from datetime import date
+
+from src.analysis.graham_algorithm import GrahamAnalyzer
+
+TODAY = date(2024, 1, 2)
+
+# 随机字段及取值范围（取两位小数，使部分值恰好落在阶梯阈值上）
+FIELD_RANGES = {
+    'total_market_cap': (1e8, 5e10),
+    'pe_ratio': (-10, 40),
+    'pb_ratio': (-1, 6),
+    'eps': (-1, 5),
+    'roe': (-0.1, 0.35),
+    'debt_ratio': (0, 1),
+    'net_profit_yoy': (-0.5, 0.5),
+    'current_ratio': (0, 3),
+    'quick_ratio': (0, 2),
+    'net_margin': (-0.1, 0.3),
+    'gross_margin': (0, 0.6),
+    'operating_cash_flow': (-1e9, 3e9),
+    'net_profit': (-1e9, 2e9),
+    'current_price': (1, 100),
+}
+
+
+def _random_stocks(n: int, seed: int = 20240102):
+    """生成随机股票数据，部分字段缺失或净利润增长率为None"""
+    rng = random.Random(seed)
+    stocks = []
+    for i in range(n):
+        stock = {'code': f'{i:06d}', 'name': f'股票{i}'}
+        for field, (low, high) in FIELD_RANGES.items():
+            if rng.random() < 0.05:
+                continue  # 字段缺失，使用默认值
+            stock[field] = round(rng.uniform(low, high), 2)
+        if rng.random() < 0.05:
+            stock['net_profit_yoy'] = None
+        stocks.append(stock)
+    return stocks
+
+
+def _close(a: float, b: float) -> bool:
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def test_batch_matches_scalar():
+    """逐只分析与批量分析的筛选结果、估值、评分和建议完全一致"""
+    analyzer = GrahamAnalyzer()
+    stocks = _random_stocks(3000)
+    batch = analyzer.analyze_batch(stocks, today=TODAY)
+
+    assert batch['pass_filter'].any() and not batch['pass_filter'].all()
+    for i, stock in enumerate(stocks):
+        single = analyzer.analyze(stock, today=TODAY)
+        context = (i, stock)
+        assert single['pass_filter'] == bool(batch['pass_filter'][i]), context
+        assert _close(single['intrinsic_value'], batch['intrinsic_value'][i]), context
+        assert _close(single['safety_margin'], batch['safety_margin'][i]), context
+        assert single['graham_score'] == batch['graham_score'][i], context
+        for item, score in single['score_details'].items():
+            assert score == batch['score_details'][item][i], (context, item)
+        assert single['recommendation'] == batch['recommendation'][i], context
+        assert single['risk_level'] == batch['risk_level'][i], context
+
+
+if __name__ == '__main__':
+    test_batch_matches_scalar()
+    print('ok')
@@ -0,0 +1,91 @@
+"""代理池测试：失败期到期后自动恢复、全部处于失败期时退回全部代理"""
+from unittest import mock
+
+from src.utils.proxy_pool import FAILED_PROXY_TTL, ProxyPool
+
+DRAWS = 200
+
+
+class FakeClock:
+    """模拟单调时钟"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _selected(pool: ProxyPool) -> set:
+    """多次随机选择，返回被选中过的代理地址"""
+    return {pool.get_proxy()['proxy'] for _ in range(DRAWS)}
+
+
+def _run(check):
+    clock = FakeClock()
+    with mock.patch('time.monotonic', clock.monotonic):
+        pool = ProxyPool()
+        pool.add_proxies_from_list(['a:1', 'b:1', 'c:1'])
+        check(pool, clock)
+
+
+def test_failed_proxy_excluded_until_ttl():
+    """连续失败3次后在FAILED_PROXY_TTL内不被选择"""
+    def check(pool, clock):
+        pool.mark_failure('a:1')
+        pool.mark_failure('a:1')
+        assert 'a:1' in _selected(pool)
+
+        pool.mark_failure('a:1')
+        assert pool.proxies['a:1']['failed_until'] == clock.now + FAILED_PROXY_TTL
+        assert pool.failed_proxies == {'a:1'}
+        assert pool.get_stats()['failed'] == 1
+        assert _selected(pool) == {'b:1', 'c:1'}
+
+    _run(check)
+
+
+def test_snapshot_expires_when_failure_period_ends():
+    """无需任何状态变化，最早的失败期结束时快照过期，代理重新参与选择"""
+    def check(pool, clock):
+        for _ in range(3):
+            pool.mark_failure('a:1')
+        failed_until = pool.proxies['a:1']['failed_until']
+        assert 'a:1' not in _selected(pool)
+        assert pool._snapshot[3] == failed_until
+
+        clock.now = failed_until - 0.001
+        assert 'a:1' not in _selected(pool)
+
+        clock.now = failed_until
+        assert _selected(pool) == {'a:1', 'b:1', 'c:1'}
+        assert pool.failed_proxies == set()
+        # 失败次数保留，只影响排序
+        assert pool.proxies['a:1']['fail_count'] == 3
+
+    _run(check)
+
+
+def test_all_failed_falls_back_to_every_proxy():
+    """全部代理处于失败期时使用全部代理，且不重置失败次数"""
+    def check(pool, clock):
+        for proxy in ('a:1', 'b:1', 'c:1'):
+            for _ in range(3):
+                pool.mark_failure(proxy)
+
+        assert pool.failed_proxies == {'a:1', 'b:1', 'c:1'}
+        assert _selected(pool) == {'a:1', 'b:1', 'c:1'}
+        assert all(p['fail_count'] == 3 for p in pool.proxies.values())
+
+        # 成功后立即清除失败期，之后只选择该代理
+        pool.mark_success('b:1')
+        assert _selected(pool) == {'b:1'}
+
+    _run(check)
+
+
+if __name__ == '__main__':
+    test_failed_proxy_excluded_until_ttl()
+    test_snapshot_expires_when_failure_period_ends()
+    test_all_failed_falls_back_to_every_proxy()
+    print('ok')
@@ -0,0 +1,45 @@
+"""风险评估测试：批量评估与逐只评估结果一致"""
+import math
+
+from src.analysis.risk_assessment import RiskAssessor
+
+
+STOCKS = [
+    {
+        'pe_ratio': 12, 'pb_ratio': 1.2, 'debt_ratio': 0.4, 'current_ratio': 2.0, 'roe': 0.15,
+        'turnover_rate': 2.5, 'circulating_market_cap': 8e9, 'amplitude': 2.0,
+    },
+    {
+        'pe_ratio': 60, 'pb_ratio': 6, 'debt_ratio': 0.75, 'current_ratio': 0.8, 'roe': -0.02,
+        'turnover_rate': 0.3, 'circulating_market_cap': 5e8, 'amplitude': 12,
+    },
+    # 边界值
+    {
+        'pe_ratio': 20, 'pb_ratio': 3, 'debt_ratio': 0.6, 'current_ratio': 1.5, 'roe': 0,
+        'turnover_rate': 1, 'circulating_market_cap': 1e9, 'amplitude': 5,
+    },
+    # 缺失、None与NaN
+    {
+        'pe_ratio': None, 'pb_ratio': math.nan, 'current_ratio': math.nan, 'roe': math.nan,
+        'turnover_rate': math.nan, 'circulating_market_cap': math.nan, 'amplitude': None,
+    },
+    {},
+]
+
+
+def test_batch_matches_scalar():
+    """逐只评估与批量评估的各项分数完全一致"""
+    assessor = RiskAssessor()
+    batch = assessor.assess_risk_batch(STOCKS)
+
+    for i, stock in enumerate(STOCKS):
+        single = assessor.assess_risk(stock)
+        assert single['risk_score'] == batch['risk_score'][i], (i, single, batch['risk_score'][i])
+        assert single['overall_risk'] == batch['overall_risk'][i], i
+        for factor, score in single['risk_factors'].items():
+            assert score == batch['risk_factors'][factor][i], (i, factor)
+
+
+if __name__ == '__main__':
+    test_batch_matches_scalar()
+    print('ok')
@@ -1,8 +1,4 @@
 """简单测试脚本（不使用Selenium）"""
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).parent.parent))
 
 from src.utils.logger import logger
 import requests
@@ -34,24 +30,25 @@ def test_connection():
 
     results = []
 
+    # 所有测试共用一个会话，复用连接并统一设置请求头
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
+                     'AppleWebKit/537.36 (KHTML, like Gecko) '
+                     'Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+    })
+
     for test in test_cases:
         logger.info(f"\n{test['name']}")
         logger.info(f"URL: {test['url']}")
 
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
-                             'AppleWebKit/537.36 (KHTML, like Gecko) '
-                             'Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'zh-CN,zh;q=0.9,en;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-            }
-
-            response = requests.get(
+            response = session.get(
                 test['url'],
-                headers=headers,
                 timeout=10,
                 allow_redirects=True
             )
@@ -84,6 +81,8 @@ def test_connection():
             logger.error(f"❌ 错误: {e}")
             results.append(False)
 
+    session.close()
+
     # 总结
     logger.info("\n" + "=" * 60)
     success_count = sum(results)
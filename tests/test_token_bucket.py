@@ -0,0 +1,91 @@
+"""令牌桶限流测试：使用模拟时钟，检查突发数量、稳定间隔以及任意60秒内的调用次数"""
+from bisect import bisect_left
+from unittest import mock
+
+from src.data_source.tushare_api import TokenBucket
+
+RATE_LIMIT = 200
+RATE_BURST = 50
+
+
+class FakeClock:
+    """模拟单调时钟，sleep直接推进时间"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+def _acquire_times(bucket: TokenBucket, clock: FakeClock, count: int):
+    """连续获取count个令牌，返回每次获取成功的时刻"""
+    times = []
+    for _ in range(count):
+        bucket.acquire()
+        times.append(clock.now)
+    return times
+
+
+def _max_calls_in_window(times, window: float = 60.0) -> int:
+    """任意长度为window的时间窗口（左闭右开）内的最多调用次数"""
+    return max(bisect_left(times, t + window) - i for i, t in enumerate(times))
+
+
+def _run(check):
+    clock = FakeClock()
+    with mock.patch('time.monotonic', clock.monotonic), mock.patch('time.sleep', clock.sleep):
+        bucket = TokenBucket.per_minute(RATE_LIMIT, RATE_BURST)
+        check(bucket, clock)
+
+
+def test_initial_burst_and_steady_spacing():
+    """空闲后立即放行rate_burst个请求，之后按 60/(rate_limit-rate_burst) 秒的间隔放行"""
+    def check(bucket, clock):
+        start = clock.now
+        times = _acquire_times(bucket, clock, RATE_BURST + 100)
+
+        assert all(t == start for t in times[:RATE_BURST])
+        interval = 60.0 / (RATE_LIMIT - RATE_BURST)
+        gaps = [b - a for a, b in zip(times[RATE_BURST:], times[RATE_BURST + 1:])]
+        assert all(abs(gap - interval) < 1e-9 for gap in gaps)
+        assert abs(times[RATE_BURST] - start - interval) < 1e-9
+
+    _run(check)
+
+
+def test_per_minute_total_within_limit():
+    """持续调用及空闲后再次突发时，任意60秒内的调用次数都不超过rate_limit"""
+    def check(bucket, clock):
+        times = _acquire_times(bucket, clock, 1000)
+        # 空闲足够长时间让令牌桶补满，再次突发
+        clock.now += 30
+        times += _acquire_times(bucket, clock, 300)
+        clock.now += 120
+        times += _acquire_times(bucket, clock, 300)
+
+        assert _max_calls_in_window(times) <= RATE_LIMIT
+
+    _run(check)
+
+
+def test_burst_clamped_below_limit():
+    """rate_burst不小于rate_limit时限制为rate_limit-1，补充速率仍为正"""
+    def check(bucket, clock):
+        bucket = TokenBucket.per_minute(10, 50)
+        assert bucket.capacity == 9
+        assert bucket.rate > 0
+        times = _acquire_times(bucket, clock, 50)
+        assert _max_calls_in_window(times) <= 10
+
+    _run(check)
+
+
+if __name__ == '__main__':
+    test_initial_burst_and_steady_spacing()
+    test_per_minute_total_within_limit()
+    test_burst_clamped_below_limit()
+    print('ok')